@@ -123,6 +123,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/",
             "-v",
             "--tb=short",
@@ -134,7 +135,7 @@ class IntegrationTestRunner:
         ]
         
         if self.parallel:
-            cmd.extend(["-n", "auto"])
+            cmd.extend(["-n", "auto", "--dist=loadgroup"])
         
         result = self.run_command(cmd)
         self.results['unit_tests'] = result
@@ -155,6 +156,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/test_integration.py",
             "-v",
             "--tb=short",
@@ -163,6 +165,9 @@ class IntegrationTestRunner:
             "--junitxml=test_output/integration_results.xml"
         ]
         
+        if self.parallel:
+            cmd.extend(["-n", "auto", "--dist=loadgroup"])
+        
         result = self.run_command(cmd)
         self.results['integration_tests'] = result
         
@@ -182,6 +187,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/test_performance.py",
             "-v",
             "--tb=short",
@@ -219,6 +225,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/test_integration.py::TestTUIIntegration",
             "tests/test_tui.py",
             "-v",
@@ -247,6 +254,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/test_integration.py::TestCrossPlatformCompatibility",
             "-v",
             "--tb=short",
@@ -273,6 +281,7 @@ class IntegrationTestRunner:
         
         cmd = [
             sys.executable, "-m", "pytest",
+            "-p", "no:cacheprovider",
             "tests/test_integration.py::TestEndToEndScenarios",
             "tests/test_integration.py::TestSystemIntegration",
             "-v",
@@ -281,6 +290,9 @@ class IntegrationTestRunner:
             "--junitxml=test_output/e2e_results.xml"
         ]
         
+        if self.parallel:
+            cmd.extend(["-n", "auto", "--dist=loadgroup"])
+        
         result = self.run_command(cmd)
         self.results['end_to_end_tests'] = result
         
@@ -7,6 +7,8 @@ The primary configuration is in pyproject.toml.
 
 import sys
 import platform
+from functools import lru_cache
+from types import MappingProxyType
 from setuptools import setup, find_packages
 
 # Read README for long description
@@ -17,8 +19,9 @@ except FileNotFoundError:
     long_description = "Cross-platform USB camera monitoring with persistent anchoring"
 
 # Platform-specific dependencies
+@lru_cache(maxsize=None)
 def get_platform_dependencies():
-    """Get platform-specific dependencies based on the current system."""
+    """Get platform-specific dependencies based on the current system (cached, read-only)."""
     deps = []
     
     system = platform.system().lower()
@@ -38,11 +41,12 @@ def get_platform_dependencies():
         # Optional enhanced dependencies are available via extras_require
         pass
     
-    return deps
+    return tuple(deps)
 
 
+@lru_cache(maxsize=None)
 def get_platform_extras():
-    """Get platform-specific extra dependencies."""
+    """Get platform-specific extra dependencies (cached, read-only)."""
     extras = {
         "tui": [
             "textual>=0.41.0",  # Terminal UI framework
@@ -51,6 +55,7 @@ def get_platform_extras():
             "pytest>=6.0",
             "pytest-cov>=2.0",
             "pytest-mock>=3.0",
+            "pytest-benchmark>=4.0",
             "black>=22.0",
             "flake8>=4.0",
             "mypy>=0.900",
@@ -62,6 +67,7 @@ def get_platform_extras():
             "pytest-cov>=2.0",
             "pytest-mock>=3.0",
             "pytest-xdist>=2.0",
+            "pytest-benchmark>=4.0",
         ],
     }
     
@@ -80,9 +86,15 @@ def get_platform_extras():
         "pyobjc-framework-IOKit>=8.0; sys_platform == 'darwin'",
     ]
     
+    # Faster registry parsing
+    extras["fast"] = [
+        "orjson>=3.6",
+    ]
+    
     # All optional features combined
     extras["all"] = [
         "textual>=0.41.0",
+        "orjson>=3.6",
         "v4l2-python>=0.2.0; sys_platform == 'linux'",
         "wmi>=1.5.1; sys_platform == 'win32'",
         "pywin32>=227; sys_platform == 'win32'",
@@ -90,12 +102,12 @@ def get_platform_extras():
         "pyobjc-framework-IOKit>=8.0; sys_platform == 'darwin'",
     ]
     
-    return extras
+    return MappingProxyType({name: tuple(reqs) for name, reqs in extras.items()})
 
 # Core dependencies required on all platforms
 install_requires = [
     "click>=8.0.0",  # CLI framework
-] + get_platform_dependencies()
+] + list(get_platform_dependencies())
 
 setup(
     name="stablecam",
@@ -127,7 +139,7 @@ setup(
     keywords="camera usb video capture monitoring cross-platform",
     python_requires=">=3.8",
     install_requires=install_requires,
-    extras_require=get_platform_extras(),
+    extras_require={name: list(reqs) for name, reqs in get_platform_extras().items()},
     entry_points={
         "console_scripts": [
             "stablecam=stablecam.cli:main",
@@ -9,7 +9,7 @@ from .models import CameraDevice, RegisteredDevice, DeviceStatus
 from .manager import StableCam
 from .registry import DeviceRegistry, RegistryError, RegistryCorruptionError
 from .backends import DeviceDetector, PlatformBackend
-from .events import EventManager, EventType
+from .events import EventManager, EventType, ALL_EVENTS
 
 __version__ = "0.1.0"
 __all__ = [
@@ -23,5 +23,6 @@ __all__ = [
     "DeviceDetector",
     "PlatformBackend",
     "EventManager",
-    "EventType"
+    "EventType",
+    "ALL_EVENTS"
 ]
\ No newline at end of file
@@ -20,6 +20,10 @@ class EventType(Enum):
     ON_STATUS_CHANGE = "on_status_change"
 
 
+# Subscribing to this event type receives every emitted event
+ALL_EVENTS = "*"
+
+
 class EventManager:
     """
     Thread-safe event manager for handling camera device events.
@@ -33,7 +37,8 @@ class EventManager:
         self._subscribers: Dict[str, List[Callable]] = {
             EventType.ON_CONNECT.value: [],
             EventType.ON_DISCONNECT.value: [],
-            EventType.ON_STATUS_CHANGE.value: []
+            EventType.ON_STATUS_CHANGE.value: [],
+            ALL_EVENTS: []
         }
         self._lock = threading.RLock()
     
@@ -42,18 +47,19 @@ class EventManager:
         Subscribe a callback function to an event type.
         
         Args:
-            event_type: The type of event to subscribe to (must be a valid EventType)
+            event_type: The type of event to subscribe to (a valid EventType,
+                       or ALL_EVENTS to receive every event)
             callback: The function to call when the event is emitted
             
         Raises:
-            ValueError: If event_type is not a valid EventType
+            ValueError: If event_type is not a valid EventType or ALL_EVENTS
             TypeError: If callback is not callable
         """
         if not callable(callback):
             raise TypeError("Callback must be callable")
         
         # Validate event type
-        valid_types = [e.value for e in EventType]
+        valid_types = [e.value for e in EventType] + [ALL_EVENTS]
         if event_type not in valid_types:
             raise ValueError(f"Invalid event type '{event_type}'. Must be one of: {valid_types}")
         
@@ -71,10 +77,10 @@ class EventManager:
             callback: The callback function to remove
             
         Raises:
-            ValueError: If event_type is not a valid EventType
+            ValueError: If event_type is not a valid EventType or ALL_EVENTS
         """
         # Validate event type
-        valid_types = [e.value for e in EventType]
+        valid_types = [e.value for e in EventType] + [ALL_EVENTS]
         if event_type not in valid_types:
             raise ValueError(f"Invalid event type '{event_type}'. Must be one of: {valid_types}")
         
@@ -87,9 +93,10 @@ class EventManager:
         """
         Emit an event to all subscribed callbacks.
         
-        Executes all callbacks for the given event type in a thread-safe manner.
-        If a callback raises an exception, it is logged but does not prevent
-        other callbacks from executing.
+        Executes all callbacks for the given event type, followed by callbacks
+        subscribed to ALL_EVENTS, in a thread-safe manner. If a callback raises
+        an exception, it is logged but does not prevent other callbacks from
+        executing.
         
         Args:
             event_type: The type of event to emit
@@ -105,7 +112,7 @@ class EventManager:
         
         # Get a copy of subscribers to avoid holding the lock during callback execution
         with self._lock:
-            callbacks = self._subscribers[event_type].copy()
+            callbacks = self._subscribers[event_type] + self._subscribers[ALL_EVENTS]
         
         logger.debug(f"Emitting {event_type} event to {len(callbacks)} subscribers")
         
@@ -130,10 +137,10 @@ class EventManager:
             int: Number of subscribers for the event type
             
         Raises:
-            ValueError: If event_type is not a valid EventType
+            ValueError: If event_type is not a valid EventType or ALL_EVENTS
         """
         # Validate event type
-        valid_types = [e.value for e in EventType]
+        valid_types = [e.value for e in EventType] + [ALL_EVENTS]
         if event_type not in valid_types:
             raise ValueError(f"Invalid event type '{event_type}'. Must be one of: {valid_types}")
         
@@ -148,11 +155,11 @@ class EventManager:
             event_type: The event type to clear. If None, clears all event types.
             
         Raises:
-            ValueError: If event_type is provided but not a valid EventType
+            ValueError: If event_type is provided but not a valid EventType or ALL_EVENTS
         """
         if event_type is not None:
             # Validate event type
-            valid_types = [e.value for e in EventType]
+            valid_types = [e.value for e in EventType] + [ALL_EVENTS]
             if event_type not in valid_types:
                 raise ValueError(f"Invalid event type '{event_type}'. Must be one of: {valid_types}")
             
@@ -9,6 +9,7 @@ for camera monitoring and management.
 import threading
 import time
 import logging
+from dataclasses import replace
 from typing import List, Optional, Callable
 from pathlib import Path
 
@@ -32,7 +33,8 @@ class StableCam:
     """
     
     def __init__(self, registry_path: Optional[Path] = None, poll_interval: float = 2.0, 
-                 log_level: str = "INFO", enable_logging: bool = True):
+                 log_level: str = "INFO", enable_logging: bool = True,
+                 clock: Optional[Callable[[float], bool]] = None):
         """
         Initialize the StableCam manager.
         
@@ -41,6 +43,9 @@ class StableCam:
             poll_interval: Interval in seconds for device monitoring loop
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             enable_logging: Whether to set up logging configuration
+            clock: Optional wait function used by the monitoring loop between polls.
+                   Called with the timeout in seconds, returns True if monitoring
+                   should stop. Defaults to waiting on the internal stop event.
         """
         # Set up logging if requested
         if enable_logging:
@@ -83,6 +88,7 @@ class StableCam:
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._clock = clock or self._stop_event.wait
         self._error_count = 0
         self._max_consecutive_errors = 10
         
@@ -168,6 +174,60 @@ class StableCam:
             logger.error(f"Device registration failed: {e}")
             raise RegistryError(f"Failed to register device: {e}")
     
+    def register_many(self, devices: List[CameraDevice]) -> List[str]:
+        """
+        Register several camera devices, writing new entries to the registry at once.
+        
+        Equivalent to calling register() for each device in turn: devices that
+        are already registered keep their stable ID and are marked connected,
+        new devices are assigned stable IDs and emit connect events.
+        
+        Args:
+            devices: The camera devices to register
+            
+        Returns:
+            List[str]: The stable ID of each device, in the same order as devices
+            
+        Raises:
+            RegistryError: If registration fails
+        """
+        try:
+            stable_ids_by_hw_id = {d.get_hardware_id(): d.stable_id for d in self.registry.get_all()}
+            
+            # Mark known devices connected; collect new ones once each, in order
+            new_devices: dict[str, CameraDevice] = {}
+            for device in devices:
+                hw_id = device.generate_hardware_id()
+                if hw_id in stable_ids_by_hw_id:
+                    stable_id = stable_ids_by_hw_id[hw_id]
+                    self.registry.update_status(stable_id, DeviceStatus.CONNECTED)
+                    logger.info(f"Device already registered with ID: {stable_id}")
+                elif hw_id not in new_devices:
+                    new_devices[hw_id] = device
+            
+            if new_devices:
+                new_ids = self.registry.register_many(list(new_devices.values()))
+                logger.info(f"Registered {len(new_ids)} new devices")
+                
+                registered_by_id = {d.stable_id: d for d in self.registry.get_all()}
+                for (hw_id, device), stable_id in zip(new_devices.items(), new_ids):
+                    stable_ids_by_hw_id[hw_id] = stable_id
+                    
+                    # Cache current device info
+                    self._current_device_info[stable_id] = device
+                    
+                    # Emit connect event
+                    registered_device = registered_by_id.get(stable_id)
+                    if registered_device:
+                        self.events.emit(EventType.ON_CONNECT.value, registered_device)
+                        self.events.emit(EventType.ON_STATUS_CHANGE.value, registered_device)
+            
+            return [stable_ids_by_hw_id[device.generate_hardware_id()] for device in devices]
+            
+        except Exception as e:
+            logger.error(f"Bulk device registration failed: {e}")
+            raise RegistryError(f"Failed to register devices: {e}")
+    
     def list(self) -> List[RegisteredDevice]:
         """
         Get all registered devices with their current status.
@@ -199,8 +259,11 @@ class StableCam:
                 # Update with current device info if available (for transient data like system_index)
                 if stable_id in self._current_device_info:
                     current_info = self._current_device_info[stable_id]
-                    device.device_info.system_index = current_info.system_index
-                    device.device_info.platform_data = current_info.platform_data
+                    device.device_info = replace(
+                        device.device_info,
+                        system_index=current_info.system_index,
+                        platform_data=current_info.platform_data
+                    )
                 
                 logger.debug(f"Found device with stable ID: {stable_id}")
             else:
@@ -215,7 +278,8 @@ class StableCam:
         Subscribe to device events.
         
         Args:
-            event_type: Type of event to subscribe to (on_connect, on_disconnect, on_status_change)
+            event_type: Type of event to subscribe to (on_connect, on_disconnect, on_status_change,
+                       or "*" for all of them)
             callback: Function to call when event occurs
             
         Raises:
@@ -281,46 +345,12 @@ class StableCam:
         logger.debug("Device monitoring loop started")
         
         while self._monitoring and not self._stop_event.is_set():
-            try:
-                self._check_device_changes()
-                self._error_count = 0  # Reset error count on success
-                
-            except PlatformDetectionError as e:
-                self._error_count += 1
-                logger.warning(f"Platform detection error in monitoring loop (#{self._error_count}): {e}")
-                
-                if self._error_count >= self._max_consecutive_errors:
-                    logger.error(f"Too many consecutive errors ({self._error_count}), stopping monitoring")
-                    self._monitoring = False
-                    break
-                
-                # Exponential backoff for platform errors
-                error_delay = min(30.0, self.poll_interval * (2 ** min(self._error_count, 5)))
-                logger.debug(f"Waiting {error_delay}s before retry due to platform error")
-                if self._stop_event.wait(timeout=error_delay):
-                    break
-                continue
-                
-            except RegistryError as e:
-                self._error_count += 1
-                logger.error(f"Registry error in monitoring loop (#{self._error_count}): {e}")
-                
-                if self._error_count >= self._max_consecutive_errors:
-                    logger.error(f"Too many consecutive registry errors, stopping monitoring")
-                    self._monitoring = False
-                    break
-                
-            except Exception as e:
-                self._error_count += 1
-                logger.error(f"Unexpected error in monitoring loop (#{self._error_count}): {e}")
-                
-                if self._error_count >= self._max_consecutive_errors:
-                    logger.error(f"Too many consecutive errors, stopping monitoring")
-                    self._monitoring = False
-                    break
+            delay = self._monitor_tick()
+            if delay is None:
+                break
             
             # Wait for next poll or stop signal
-            if self._stop_event.wait(timeout=self.poll_interval):
+            if self._clock(delay):
                 break
         
         if self._error_count >= self._max_consecutive_errors:
@@ -328,6 +358,56 @@ class StableCam:
         else:
             logger.debug("Device monitoring loop stopped normally")
     
+    def _monitor_tick(self) -> Optional[float]:
+        """
+        Run a single monitoring iteration.
+        
+        Checks for device changes once and updates the consecutive error count.
+        Called by the monitoring loop on every poll, and directly by tests to
+        drive monitoring synchronously without a background thread.
+        
+        Returns:
+            Optional[float]: Seconds to wait before the next iteration, or None
+                if monitoring should stop because of too many consecutive errors
+        """
+        try:
+            self._check_device_changes()
+            self._error_count = 0  # Reset error count on success
+            
+        except PlatformDetectionError as e:
+            self._error_count += 1
+            logger.warning(f"Platform detection error in monitoring loop (#{self._error_count}): {e}")
+            
+            if self._error_count >= self._max_consecutive_errors:
+                logger.error(f"Too many consecutive errors ({self._error_count}), stopping monitoring")
+                self._monitoring = False
+                return None
+            
+            # Exponential backoff for platform errors
+            error_delay = min(30.0, self.poll_interval * (2 ** min(self._error_count, 5)))
+            logger.debug(f"Waiting {error_delay}s before retry due to platform error")
+            return error_delay
+            
+        except RegistryError as e:
+            self._error_count += 1
+            logger.error(f"Registry error in monitoring loop (#{self._error_count}): {e}")
+            
+            if self._error_count >= self._max_consecutive_errors:
+                logger.error(f"Too many consecutive registry errors, stopping monitoring")
+                self._monitoring = False
+                return None
+            
+        except Exception as e:
+            self._error_count += 1
+            logger.error(f"Unexpected error in monitoring loop (#{self._error_count}): {e}")
+            
+            if self._error_count >= self._max_consecutive_errors:
+                logger.error(f"Too many consecutive errors, stopping monitoring")
+                self._monitoring = False
+                return None
+        
+        return self.poll_interval
+    
     def _check_device_changes(self) -> None:
         """
         Check for device connection/disconnection changes and emit events.
@@ -368,7 +448,10 @@ class StableCam:
                     
                     # Update system index in case it changed
                     if registered_device.device_info.system_index != detected_device.system_index:
-                        registered_device.device_info.system_index = detected_device.system_index
+                        registered_device.device_info = replace(
+                            registered_device.device_info,
+                            system_index=detected_device.system_index
+                        )
                         # Update the registry with the new device info
                         try:
                             self._update_device_info_in_registry(stable_id, detected_device)
@@ -5,10 +5,11 @@ This module defines the primary data structures used throughout the StableCam
 system for representing camera devices, registered devices, and device status.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import Any, Container, Dict, Optional, Tuple
 import hashlib
 import time
 
@@ -20,13 +21,15 @@ class DeviceStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CameraDevice:
     """
     Represents a detected USB camera with hardware identifiers.
     
     This class contains all the information needed to uniquely identify
     a camera device across different connection states and ports.
+    Instances are immutable and hashable; use dataclasses.replace() to
+    derive an updated copy.
     """
     system_index: int
     vendor_id: str
@@ -34,19 +37,21 @@ class CameraDevice:
     serial_number: Optional[str]
     port_path: Optional[str]
     label: str
-    platform_data: Dict[str, Any]
+    # Dicts aren't hashable, so platform data is compared but not hashed
+    platform_data: Dict[str, Any] = field(hash=False)
 
-    def generate_hardware_id(self) -> str:
+    @cached_property
+    def hardware_id(self) -> str:
         """
-        Generate a unique hardware identifier for this device.
+        Unique hardware identifier for this device, computed on first access.
         
         Uses a hierarchical approach:
         1. Primary: Serial number (if available)
         2. Secondary: Vendor ID + Product ID + Port Path
         3. Fallback: Vendor ID + Product ID + Hash of detection timestamp
         
-        Returns:
-            str: A unique hardware identifier for the device
+        The fallback timestamp is captured on first access, so repeated
+        lookups on the same instance return the same identifier.
         """
         # Primary: Use serial number if available
         if self.serial_number:
@@ -58,9 +63,18 @@ class CameraDevice:
         
         # Fallback: Use vendor/product ID with timestamp hash
         # This ensures uniqueness even for identical devices without serial numbers
-        timestamp_hash = hashlib.md5(str(time.time()).encode()).hexdigest()[:8]
+        timestamp_hash = hashlib.blake2b(str(time.time()).encode(), digest_size=4).hexdigest()
         return f"vid-pid-hash:{self.vendor_id}:{self.product_id}:{timestamp_hash}"
 
+    def generate_hardware_id(self) -> str:
+        """
+        Generate a unique hardware identifier for this device.
+        
+        Returns:
+            str: A unique hardware identifier for the device
+        """
+        return self.hardware_id
+
     def matches_hardware_id(self, hardware_id: str) -> bool:
         """
         Check if this device matches the given hardware identifier.
@@ -71,7 +85,7 @@ class CameraDevice:
         Returns:
             bool: True if this device matches the hardware ID
         """
-        return self.generate_hardware_id() == hardware_id
+        return self.hardware_id == hardware_id
 
 
 @dataclass
@@ -108,23 +122,36 @@ class RegisteredDevice:
         return self.device_info.generate_hardware_id()
 
 
-def generate_stable_id(device: CameraDevice, existing_ids: set) -> str:
+def generate_stable_id(existing_ids: Container[str], next_number: int = 1) -> Tuple[str, int]:
     """
-    Generate a unique stable ID for a camera device.
+    Generate a unique stable ID from a sequence counter.
     
     Creates human-readable stable IDs in the format 'stable-cam-XXX'
-    where XXX is a zero-padded sequential number.
+    where XXX is a zero-padded sequential number. Numbers are never reused;
+    any ID already present (e.g. in a hand-edited registry) is stepped over.
     
     Args:
-        device: The camera device to generate an ID for
-        existing_ids: Set of already used stable IDs
+        existing_ids: Already used stable IDs
+        next_number: The next unassigned sequence number
         
     Returns:
-        str: A unique stable ID for the device
+        Tuple[str, int]: The stable ID and the sequence number to use next
     """
-    counter = 1
-    while True:
-        stable_id = f"stable-cam-{counter:03d}"
-        if stable_id not in existing_ids:
-            return stable_id
-        counter += 1
\ No newline at end of file
+    stable_id = format_stable_id(next_number)
+    while stable_id in existing_ids:
+        next_number += 1
+        stable_id = format_stable_id(next_number)
+    return stable_id, next_number + 1
+
+
+def format_stable_id(number: int) -> str:
+    """Format a sequence number as a 'stable-cam-XXX' stable ID."""
+    return f"stable-cam-{number:03d}"
+
+
+def parse_stable_id(stable_id: str) -> Optional[int]:
+    """Return the sequence number of a 'stable-cam-XXX' ID, or None for other IDs."""
+    prefix, _, number = stable_id.rpartition("-")
+    if prefix != "stable-cam" or not number.isdigit():
+        return None
+    return int(number)
\ No newline at end of file
@@ -8,6 +8,7 @@ checking for platform-specific dependencies and capabilities.
 import platform
 import sys
 import subprocess
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 
@@ -18,6 +19,13 @@ def get_platform_info() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Platform information including system, release, version, etc.
     """
+    # Copy so callers can't modify the cached result
+    return dict(_get_platform_info())
+
+
+@lru_cache(maxsize=1)
+def _get_platform_info() -> Dict[str, str]:
+    """Collect platform information once per process."""
     return {
         'system': platform.system(),
         'release': platform.release(),
@@ -30,16 +38,19 @@ def get_platform_info() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1)
 def is_linux() -> bool:
     """Check if running on Linux."""
     return platform.system().lower() == 'linux'
 
 
+@lru_cache(maxsize=1)
 def is_windows() -> bool:
     """Check if running on Windows."""
     return platform.system().lower() == 'windows'
 
 
+@lru_cache(maxsize=1)
 def is_macos() -> bool:
     """Check if running on macOS."""
     return platform.system().lower() == 'darwin'
@@ -52,6 +63,13 @@ def get_recommended_dependencies() -> List[str]:
     Returns:
         List[str]: List of recommended package names for pip install
     """
+    # Copy so callers can't modify the cached result
+    return list(_get_recommended_dependencies())
+
+
+@lru_cache(maxsize=1)
+def _get_recommended_dependencies() -> List[str]:
+    """Build the recommended dependency list once per process."""
     deps = []
     
     if is_linux():
@@ -5,22 +5,34 @@ This module provides the DeviceRegistry class that manages persistent storage
 and retrieval of registered camera devices with thread-safe operations.
 """
 
+import copy
 import json
+import mmap
 import os
 import fcntl
 import tempfile
 import shutil
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+from contextlib import contextmanager, nullcontext
 
-from .models import CameraDevice, RegisteredDevice, DeviceStatus, generate_stable_id
+from .models import CameraDevice, RegisteredDevice, DeviceStatus, generate_stable_id, parse_stable_id
 from .backends.exceptions import StableCamError
 
+try:
+    import orjson
+except ImportError:  # Optional faster decoding, installed with the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# DeviceStatus members by stored value; a dict lookup is much cheaper than
+# DeviceStatus(value) when decoding every device on each read
+_STATUS_BY_VALUE = {status.value: status for status in DeviceStatus}
+
 
 class RegistryError(StableCamError):
     """Base exception for registry operations."""
@@ -59,17 +71,57 @@ class DeviceRegistry:
     updates with JSON-based persistence and atomic write operations.
     """
     
-    REGISTRY_VERSION = "1.0"
+    REGISTRY_VERSION = "1.1"
+    # Older schema versions that are upgraded in place on the next registration
+    MIGRATABLE_VERSIONS = ("1.0",)
     DEFAULT_REGISTRY_DIR = Path.home() / ".stablecam"
     DEFAULT_REGISTRY_FILE = "registry.json"
     
-    def __init__(self, registry_path: Optional[Path] = None):
+    BACKEND_FILE = "file"
+    BACKEND_MEMORY = "memory"
+    BACKEND_ENV_VAR = "STABLECAM_REGISTRY_BACKEND"
+    
+    DURABILITY_STRICT = "strict"
+    DURABILITY_NONE = "none"
+    DURABILITY_ENV_VAR = "STABLECAM_REGISTRY_DURABILITY"
+    
+    MULTIPROCESS_ENV_VAR = "STABLECAM_MULTIPROCESS"
+    
+    # In-process storage for the memory backend, shared by every registry
+    # instance that points at the same path
+    _memory_stores: Dict[str, Dict] = {}
+    _memory_locks: Dict[str, threading.RLock] = {}
+    _memory_stores_lock = threading.Lock()
+    
+    # Per-path locks that stand in for flock() when only threads of this
+    # process share a registry file
+    _thread_locks: Dict[str, threading.RLock] = {}
+    _thread_locks_lock = threading.Lock()
+    
+    def __init__(self, registry_path: Optional[Path] = None, backend: Optional[str] = None,
+                 durability: Optional[str] = None, clock: Callable[[], datetime] = datetime.now,
+                 multiprocess: Optional[bool] = None):
         """
         Initialize the device registry.
         
         Args:
             registry_path: Optional custom path for registry file.
                           Defaults to ~/.stablecam/registry.json
+            backend: Storage backend, either "file" (JSON on disk) or "memory"
+                    (in-process dict, nothing touches the disk). Defaults to the
+                    STABLECAM_REGISTRY_BACKEND environment variable, then "file".
+            durability: Either "strict" (fsync every write before it replaces the
+                       registry file) or "none" (leave flushing to the OS, for
+                       throwaway registries such as test fixtures). Defaults to the
+                       STABLECAM_REGISTRY_DURABILITY environment variable, then "strict".
+            clock: Callable returning the current time, used for every timestamp
+                  the registry records. Defaults to datetime.now.
+            multiprocess: Whether other processes may share the registry file. When
+                         True, file access is serialized with flock(); when False,
+                         an in-process lock per registry path is used instead, which
+                         is only safe for single-process embedded use and tests.
+                         Defaults to False if the STABLECAM_MULTIPROCESS environment
+                         variable is "0", otherwise True.
         """
         if registry_path is None:
             self.registry_dir = self.DEFAULT_REGISTRY_DIR
@@ -78,6 +130,41 @@ class DeviceRegistry:
             self.registry_path = Path(registry_path)
             self.registry_dir = self.registry_path.parent
         
+        if backend is None:
+            backend = os.environ.get(self.BACKEND_ENV_VAR, self.BACKEND_FILE)
+        if backend not in (self.BACKEND_FILE, self.BACKEND_MEMORY):
+            raise RegistryError(
+                f"Unknown registry backend: {backend}",
+                registry_path=self.registry_path
+            )
+        self.backend = backend
+        
+        if durability is None:
+            durability = os.environ.get(self.DURABILITY_ENV_VAR, self.DURABILITY_STRICT)
+        if durability not in (self.DURABILITY_STRICT, self.DURABILITY_NONE):
+            raise RegistryError(
+                f"Unknown registry durability: {durability}",
+                registry_path=self.registry_path
+            )
+        self.durability = durability
+        
+        if multiprocess is None:
+            multiprocess = os.environ.get(self.MULTIPROCESS_ENV_VAR) != "0"
+        self.multiprocess = multiprocess
+        
+        self._clock = clock
+        self._memory_lock: Optional[threading.RLock] = None
+        
+        # Last validated registry file contents, keyed on the file's
+        # inode, ctime, mtime and size so unchanged files aren't parsed again;
+        # the inode changes on every os.replace() even when timestamps are coarse
+        self._read_cache_key: Optional[Tuple[int, int, int, int]] = None
+        self._read_cache: Optional[Dict] = None
+        
+        if self.backend == self.BACKEND_MEMORY:
+            self._init_memory_store()
+            return
+        
         try:
             # Ensure registry directory exists
             self.registry_dir.mkdir(parents=True, exist_ok=True)
@@ -114,18 +201,51 @@ class DeviceRegistry:
             except RegistryCorruptionError:
                 # Already handled in _validate_registry
                 pass
+            except RegistryLockError:
+                # Another process holds the registry; its contents aren't corrupt
+                raise
             except Exception as e:
                 logger.warning(f"Registry validation failed: {e}")
                 # Try to recover or recreate
                 self._handle_registry_corruption(e)
     
+    def _init_memory_store(self) -> None:
+        """Attach to (or create) the in-process store for this registry path."""
+        key = str(self.registry_path)
+        with self._memory_stores_lock:
+            if key not in self._memory_stores:
+                self._memory_stores[key] = {
+                    "version": self.REGISTRY_VERSION,
+                    "next_id": 1,
+                    "devices": {},
+                    "created_at": self._clock().isoformat(),
+                    "last_modified": self._clock().isoformat()
+                }
+                self._memory_locks[key] = threading.RLock()
+                logger.debug(f"Created in-memory registry: {key}")
+            self._memory_lock = self._memory_locks[key]
+    
+    def _thread_lock(self) -> threading.RLock:
+        """Return the in-process lock shared by every registry for this path."""
+        key = str(self.registry_path)
+        with self._thread_locks_lock:
+            return self._thread_locks.setdefault(key, threading.RLock())
+    
+    @classmethod
+    def clear_memory_stores(cls) -> None:
+        """Drop all in-process registry data held by the memory backend."""
+        with cls._memory_stores_lock:
+            cls._memory_stores.clear()
+            cls._memory_locks.clear()
+    
     def _create_empty_registry(self) -> None:
         """Create an empty registry file with proper structure."""
         empty_registry = {
             "version": self.REGISTRY_VERSION,
+            "next_id": 1,
             "devices": {},
-            "created_at": datetime.now().isoformat(),
-            "last_modified": datetime.now().isoformat()
+            "created_at": self._clock().isoformat(),
+            "last_modified": self._clock().isoformat()
         }
         try:
             self._write_registry_atomic(empty_registry)
@@ -145,8 +265,11 @@ class DeviceRegistry:
             RegistryCorruptionError: If registry is corrupted beyond repair
         """
         try:
+            # Hold the lock so an in-place rewrite by another process
+            # isn't mistaken for corruption
             with open(self.registry_path, 'r') as f:
-                data = json.load(f)
+                with self._file_lock(f):
+                    data = json.load(f)
             
             # Check required fields
             required_fields = ["version", "devices"]
@@ -158,7 +281,7 @@ class DeviceRegistry:
                     )
             
             # Validate version compatibility
-            if data["version"] != self.REGISTRY_VERSION:
+            if data["version"] != self.REGISTRY_VERSION and data["version"] not in self.MIGRATABLE_VERSIONS:
                 logger.warning(f"Registry version mismatch: {data['version']} != {self.REGISTRY_VERSION}")
                 # Could implement migration logic here
             
@@ -180,7 +303,7 @@ class DeviceRegistry:
         except FileNotFoundError:
             # File doesn't exist, will be created
             pass
-        except RegistryCorruptionError:
+        except (RegistryCorruptionError, RegistryLockError):
             raise
         except Exception as e:
             self._handle_registry_corruption(e)
@@ -258,7 +381,7 @@ class DeviceRegistry:
         Returns:
             Path: Path to the backup file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._clock().strftime("%Y%m%d_%H%M%S")
         backup_path = self.registry_path.with_suffix(f'.backup_{timestamp}.json')
         
         try:
@@ -292,7 +415,7 @@ class DeviceRegistry:
                 if isinstance(data, dict) and "devices" in data:
                     logger.info(f"Successfully recovered data from {backup_file}")
                     # Update metadata
-                    data["last_modified"] = datetime.now().isoformat()
+                    data["last_modified"] = self._clock().isoformat()
                     data["recovered_from"] = str(backup_file)
                     return data
                     
@@ -308,10 +431,26 @@ class DeviceRegistry:
         """
         Context manager for file locking with timeout.
         
+        Takes flock() on the file when the registry is shared between
+        processes, otherwise the in-process lock for the registry path.
+        
         Args:
             file_handle: File handle to lock
             timeout: Maximum time to wait for lock in seconds
         """
+        if not self.multiprocess:
+            thread_lock = self._thread_lock()
+            if not thread_lock.acquire(timeout=timeout):
+                raise RegistryLockError(
+                    f"Could not acquire registry lock within {timeout} seconds",
+                    registry_path=self.registry_path
+                )
+            try:
+                yield
+            finally:
+                thread_lock.release()
+            return
+        
         import time
         
         start_time = time.time()
@@ -341,10 +480,61 @@ class DeviceRegistry:
                 except (IOError, OSError) as e:
                     logger.warning(f"Failed to release file lock: {e}")
     
+    def _sync(self, file_handle) -> None:
+        """Flush a written file, forcing it to disk unless durability is "none"."""
+        file_handle.flush()
+        if self.durability == self.DURABILITY_STRICT:
+            os.fsync(file_handle.fileno())
+    
+    @staticmethod
+    def _load_mapped(file_handle) -> Dict:
+        """
+        Parse JSON from an open binary file through a read-only memory map.
+        
+        The parser reads the bytes straight from the page cache mapping
+        rather than through a buffered file read. orjson, when installed,
+        parses the mapping in place; its decode errors subclass
+        json.JSONDecodeError so callers handle both parsers alike.
+        """
+        if os.fstat(file_handle.fileno()).st_size == 0:
+            # Empty files can't be mapped; let json raise its usual decode error
+            return json.loads(b"")
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+    
+    @staticmethod
+    def _copy_registry_data(data: Dict) -> Dict:
+        """Copy registry data deep enough that callers can edit device entries."""
+        copied = dict(data)
+        copied["devices"] = devices = {}
+        for stable_id, entry in data["devices"].items():
+            entry = dict(entry)
+            # platform_data is the only nested value in a device entry
+            if entry.get("platform_data"):
+                entry["platform_data"] = copy.deepcopy(entry["platform_data"])
+            devices[stable_id] = entry
+        return copied
+    
+    @staticmethod
+    def _cache_key(st: os.stat_result) -> Tuple[int, int, int, int]:
+        """Identify a version of the registry file from its stat() result."""
+        return (st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+    
+    def _invalidate_read_cache(self) -> None:
+        """Forget the cached registry contents after this instance writes the file."""
+        self._read_cache_key = None
+        self._read_cache = None
+    
     def _read_registry(self) -> Dict:
         """
         Read and parse the registry file with file locking.
         
+        Unchanged files are served from the last validated read, at the cost
+        of a single stat() call.
+        
         Returns:
             Dict: The parsed registry data
             
@@ -352,18 +542,34 @@ class DeviceRegistry:
             RegistryCorruptionError: If registry file is corrupted
             RegistryError: If read operation fails
         """
+        if self._memory_lock is not None:
+            with self._memory_lock:
+                data = copy.deepcopy(self._memory_stores[str(self.registry_path)])
+            data["last_accessed"] = self._clock().isoformat()
+            return data
+        
         if not self.registry_path.exists():
             logger.debug("Registry file doesn't exist, creating empty registry")
             self._create_empty_registry()
+        
+        try:
+            st = os.stat(self.registry_path)
+            if self._cache_key(st) == self._read_cache_key:
+                data = self._copy_registry_data(self._read_cache)
+                data["last_accessed"] = self._clock().isoformat()
+                return data
+        except OSError:
+            pass
             
         max_retries = 3
         retry_count = 0
         
         while retry_count < max_retries:
             try:
-                with open(self.registry_path, 'r', encoding='utf-8') as f:
+                with open(self.registry_path, 'rb') as f:
                     with self._file_lock(f):
-                        data = json.load(f)
+                        data = self._load_mapped(f)
+                        st = os.fstat(f.fileno())
                         
                 # Validate registry structure
                 if not isinstance(data, dict) or "version" not in data or "devices" not in data:
@@ -373,8 +579,13 @@ class DeviceRegistry:
                     retry_count += 1
                     continue
                 
+                # Keep the validated contents for reads until the file changes
+                self._read_cache = data
+                self._read_cache_key = self._cache_key(st)
+                data = self._copy_registry_data(data)
+                
                 # Update last access time
-                data["last_accessed"] = datetime.now().isoformat()
+                data["last_accessed"] = self._clock().isoformat()
                 logger.debug(f"Successfully read registry with {len(data.get('devices', {}))} devices")
                 return data
                 
@@ -430,9 +641,15 @@ class DeviceRegistry:
             RegistryError: If write operation fails
         """
         # Update metadata
-        data["last_modified"] = datetime.now().isoformat()
+        data["last_modified"] = self._clock().isoformat()
         data["version"] = self.REGISTRY_VERSION
         
+        if self._memory_lock is not None:
+            with self._memory_lock:
+                self._memory_stores[str(self.registry_path)] = copy.deepcopy(data)
+            return
+        
+        self._invalidate_read_cache()
         tmp_path = None
         try:
             # Write to temporary file first
@@ -444,8 +661,7 @@ class DeviceRegistry:
                 encoding='utf-8'
             ) as tmp_file:
                 json.dump(data, tmp_file, indent=2, default=str, ensure_ascii=False)
-                tmp_file.flush()
-                os.fsync(tmp_file.fileno())
+                self._sync(tmp_file)
                 tmp_path = tmp_file.name
             
             # Verify the written file is valid JSON
@@ -502,6 +718,32 @@ class DeviceRegistry:
         Raises:
             RegistryError: If device is already registered
         """
+        return self.register_many([device])[0]
+    
+    def register_many(self, devices: List[CameraDevice]) -> List[str]:
+        """
+        Register several new camera devices with a single registry write.
+        
+        Args:
+            devices: The camera devices to register
+            
+        Returns:
+            List[str]: The assigned stable IDs, in the same order as devices
+            
+        Raises:
+            RegistryError: If any device is already registered; nothing is
+                           written in that case
+        """
+        # One lock acquisition, read and fsync'd write covers the whole batch
+        if self._memory_lock is not None:
+            with self._memory_lock:
+                registry_data = self._read_registry()
+                stable_ids = self._add_devices(registry_data, devices)
+                self._write_registry_atomic(registry_data)
+            return stable_ids
+        
+        self._invalidate_read_cache()
+        
         # Use file locking for the entire registration process to ensure atomicity
         with open(self.registry_path, 'r+') as f:
             with self._file_lock(f):
@@ -510,46 +752,89 @@ class DeviceRegistry:
                 try:
                     registry_data = json.load(f)
                 except json.JSONDecodeError:
-                    registry_data = {"version": self.REGISTRY_VERSION, "devices": {}}
+                    registry_data = {"version": self.REGISTRY_VERSION, "next_id": 1, "devices": {}}
                 
-                # Check if device is already registered
-                hardware_id = device.generate_hardware_id()
-                for device_data in registry_data["devices"].values():
-                    existing_device_info = CameraDevice(
-                        system_index=0,
-                        vendor_id=device_data["vendor_id"],
-                        product_id=device_data["product_id"],
-                        serial_number=device_data["serial_number"],
-                        port_path=device_data["port_path"],
-                        label=device_data["label"],
-                        platform_data=device_data["platform_data"]
-                    )
-                    if existing_device_info.generate_hardware_id() == hardware_id:
-                        raise RegistryError(f"Device already registered with ID: {device_data['stable_id']}")
-                
-                # Generate unique stable ID
-                existing_ids = set(registry_data["devices"].keys())
-                stable_id = generate_stable_id(device, existing_ids)
-                
-                # Create registered device entry
-                registered_device = RegisteredDevice(
-                    stable_id=stable_id,
-                    device_info=device,
-                    status=DeviceStatus.CONNECTED,
-                    registered_at=datetime.now(),
-                    last_seen=datetime.now()
-                )
-                
-                # Add to registry
-                registry_data["devices"][stable_id] = self._serialize_device(registered_device)
+                stable_ids = self._add_devices(registry_data, devices)
                 
                 # Write back to file
                 f.seek(0)
                 f.truncate()
                 json.dump(registry_data, f, indent=2, default=str)
-                f.flush()
-                os.fsync(f.fileno())
+                self._sync(f)
         
+        return stable_ids
+    
+    def _add_devices(self, registry_data: Dict, devices: List[CameraDevice]) -> List[str]:
+        """Add several device entries to already-loaded registry data."""
+        hardware_index = self._hardware_id_index(registry_data)
+        if "next_id" not in registry_data:
+            registry_data["next_id"] = self._migrate_next_id(registry_data)
+            registry_data["version"] = self.REGISTRY_VERSION
+        return [self._add_device(registry_data, device, hardware_index) for device in devices]
+    
+    @staticmethod
+    def _migrate_next_id(registry_data: Dict) -> int:
+        """Derive the next stable ID number for registry data written before version 1.1."""
+        numbers = [parse_stable_id(stable_id) for stable_id in registry_data["devices"]]
+        return max((number for number in numbers if number is not None), default=0) + 1
+    
+    def _hardware_id_index(self, registry_data: Dict) -> Dict[str, str]:
+        """Map the hardware ID of every device in registry data to its stable ID."""
+        index = {}
+        for device_data in registry_data["devices"].values():
+            existing_device_info = CameraDevice(
+                system_index=0,
+                vendor_id=device_data["vendor_id"],
+                product_id=device_data["product_id"],
+                serial_number=device_data["serial_number"],
+                port_path=device_data["port_path"],
+                label=device_data["label"],
+                platform_data=device_data["platform_data"]
+            )
+            index[existing_device_info.hardware_id] = device_data["stable_id"]
+        return index
+    
+    def _add_device(self, registry_data: Dict, device: CameraDevice,
+                    hardware_index: Dict[str, str]) -> str:
+        """
+        Add a device entry to already-loaded registry data.
+        
+        Args:
+            registry_data: Registry data to modify in place
+            device: The camera device to add
+            hardware_index: Hardware ID to stable ID map of registry_data, kept
+                            up to date when adding several devices in a row
+            
+        Returns:
+            str: The assigned stable ID
+            
+        Raises:
+            RegistryError: If device is already registered
+        """
+        # Check if device is already registered
+        hardware_id = device.generate_hardware_id()
+        existing_id = hardware_index.get(hardware_id)
+        if existing_id is not None:
+            raise RegistryError(f"Device already registered with ID: {existing_id}")
+        
+        # Take the next stable ID from the persisted counter
+        stable_id, registry_data["next_id"] = generate_stable_id(
+            registry_data["devices"], registry_data["next_id"]
+        )
+        
+        # Create registered device entry
+        now = self._clock()
+        registered_device = RegisteredDevice(
+            stable_id=stable_id,
+            device_info=device,
+            status=DeviceStatus.CONNECTED,
+            registered_at=now,
+            last_seen=now
+        )
+        
+        # Add to registry
+        registry_data["devices"][stable_id] = self._serialize_device(registered_device)
+        hardware_index[hardware_id] = stable_id
         return stable_id
     
     def get_all(self) -> List[RegisteredDevice]:
@@ -595,19 +880,21 @@ class DeviceRegistry:
         Raises:
             RegistryError: If device is not found
         """
-        registry_data = self._read_registry()
-        
-        if stable_id not in registry_data["devices"]:
-            raise RegistryError(f"Device not found: {stable_id}")
-        
-        # Update status and last_seen if connecting
-        device_data = registry_data["devices"][stable_id]
-        device_data["status"] = status.value
-        
-        if status == DeviceStatus.CONNECTED:
-            device_data["last_seen"] = datetime.now().isoformat()
-        
-        self._write_registry_atomic(registry_data)
+        # The memory backend holds its lock across the read-modify-write cycle
+        with self._memory_lock or nullcontext():
+            registry_data = self._read_registry()
+            
+            if stable_id not in registry_data["devices"]:
+                raise RegistryError(f"Device not found: {stable_id}")
+            
+            # Update status and last_seen if connecting
+            device_data = registry_data["devices"][stable_id]
+            device_data["status"] = status.value
+            
+            if status == DeviceStatus.CONNECTED:
+                device_data["last_seen"] = self._clock().isoformat()
+            
+            self._write_registry_atomic(registry_data)
     
     def find_by_hardware_id(self, device: CameraDevice) -> Optional[RegisteredDevice]:
         """
@@ -622,24 +909,26 @@ class DeviceRegistry:
         hardware_id = device.generate_hardware_id()
         
         for registered_device in self.get_all():
-            if registered_device.get_hardware_id() == hardware_id:
+            if registered_device.device_info.matches_hardware_id(hardware_id):
                 return registered_device
                 
         return None
     
     def _serialize_device(self, device: RegisteredDevice) -> Dict:
         """Convert RegisteredDevice to dictionary for JSON storage."""
+        device_info = device.device_info
+        last_seen = device.last_seen
         return {
             "stable_id": device.stable_id,
-            "vendor_id": device.device_info.vendor_id,
-            "product_id": device.device_info.product_id,
-            "serial_number": device.device_info.serial_number,
-            "port_path": device.device_info.port_path,
-            "label": device.device_info.label,
-            "platform_data": device.device_info.platform_data,
+            "vendor_id": device_info.vendor_id,
+            "product_id": device_info.product_id,
+            "serial_number": device_info.serial_number,
+            "port_path": device_info.port_path,
+            "label": device_info.label,
+            "platform_data": device_info.platform_data,
             "status": device.status.value,
             "registered_at": device.registered_at.isoformat(),
-            "last_seen": device.last_seen.isoformat() if device.last_seen else None
+            "last_seen": last_seen.isoformat() if last_seen else None
         }
     
     def _deserialize_device(self, data: Dict) -> RegisteredDevice:
@@ -657,7 +946,8 @@ class DeviceRegistry:
         return RegisteredDevice(
             stable_id=data["stable_id"],
             device_info=device_info,
-            status=DeviceStatus(data["status"]),
+            # Falls back to DeviceStatus() so unknown values still raise ValueError
+            status=_STATUS_BY_VALUE.get(data["status"]) or DeviceStatus(data["status"]),
             registered_at=datetime.fromisoformat(data["registered_at"]),
             last_seen=datetime.fromisoformat(data["last_seen"]) if data["last_seen"] else None
         )
\ No newline at end of file
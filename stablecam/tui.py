@@ -8,6 +8,9 @@ for device state changes.
 
 import asyncio
 import logging
+import math
+import time
+from array import array
 from datetime import datetime
 from typing import List, Optional
 
@@ -30,6 +33,13 @@ from .registry import RegistryError
 
 logger = logging.getLogger(__name__)
 
+# Status indicator and CSS class shown for each device status
+_STATUS_DISPLAY = {
+    DeviceStatus.CONNECTED: ("● Online", "connected"),
+    DeviceStatus.DISCONNECTED: ("○ Offline", "disconnected"),
+    DeviceStatus.ERROR: ("✗ Error", "error"),
+}
+
 
 class DeviceTable(DataTable):
     """Custom DataTable widget for displaying camera devices."""
@@ -140,7 +150,14 @@ class StableCamTUI(App):
         
         # Track device changes for visual indicators
         self._last_device_states: dict[str, DeviceStatus] = {}
-        self._recent_changes: dict[str, datetime] = {}
+        # Monotonic timestamps of each device's last status change
+        self._recent_changes: dict[str, float] = {}
+        
+        # Pending status changes appended by event handlers on the monitor
+        # thread, as parallel arrays of stable IDs and monotonic timestamps;
+        # folded into _recent_changes when next read
+        self._pending_change_ids: List[str] = []
+        self._pending_change_times = array('d')
     
     def compose(self) -> ComposeResult:
         """Compose the TUI layout."""
@@ -283,23 +300,29 @@ class StableCamTUI(App):
     
     def _get_status_display(self, device: RegisteredDevice) -> tuple[str, str]:
         """Get status indicator and CSS class for a device."""
-        if device.status == DeviceStatus.CONNECTED:
-            return "● Online", "connected"
-        elif device.status == DeviceStatus.DISCONNECTED:
-            return "○ Offline", "disconnected"
-        else:
-            return "✗ Error", "error"
+        return _STATUS_DISPLAY.get(device.status, _STATUS_DISPLAY[DeviceStatus.ERROR])
     
     def _is_recent_change(self, stable_id: str) -> bool:
         """Check if a device had a recent status change (within last 5 seconds)."""
-        if stable_id in self._recent_changes:
-            time_diff = datetime.now() - self._recent_changes[stable_id]
-            return time_diff.total_seconds() < 5.0
-        return False
+        self._drain_pending_changes()
+        return time.monotonic() - self._recent_changes.get(stable_id, -math.inf) < 5.0
     
     def _mark_recent_change(self, stable_id: str) -> None:
         """Mark a device as having a recent status change."""
-        self._recent_changes[stable_id] = datetime.now()
+        # ID first: a timestamp is only appended once its ID is in place
+        self._pending_change_ids.append(stable_id)
+        self._pending_change_times.append(time.monotonic())
+    
+    def _drain_pending_changes(self) -> None:
+        """Fold pending status changes into _recent_changes."""
+        count = len(self._pending_change_times)
+        if not count:
+            return
+        # Later entries overwrite earlier ones for the same device
+        self._recent_changes.update(zip(self._pending_change_ids[:count], self._pending_change_times[:count]))
+        # Entries appended meanwhile stay pending for the next drain
+        del self._pending_change_ids[:count]
+        del self._pending_change_times[:count]
     
     async def _register_new_device(self) -> None:
         """Register a new detected camera device."""
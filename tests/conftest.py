@@ -6,12 +6,19 @@ used across all test modules for consistent testing setup.
 """
 
 import pytest
-import tempfile
 import threading
 import time
 import os
+import platform
+import shutil
+import subprocess
 import sys
+import tempfile
+import uuid
+import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from typing import List, Generator, Dict, Any
 
@@ -23,6 +30,18 @@ from stablecam import CameraDevice, RegisteredDevice, DeviceStatus, StableCam
 from stablecam.registry import DeviceRegistry
 
 
+def pytest_addoption(parser):
+    """Add command line options for opt-in stress testing."""
+    parser.addoption(
+        "--run-stress", action="store_true", default=False,
+        help="run tests marked stress"
+    )
+    parser.addoption(
+        "--stress-scale", action="store", type=float, default=1.0,
+        help="scale factor for device counts in stress tests (default: 1.0)"
+    )
+
+
 # Test markers configuration
 def pytest_configure(config):
     """Configure pytest markers."""
@@ -34,10 +53,16 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "macos: marks tests that require macOS platform")
     config.addinivalue_line("markers", "performance: marks tests as performance tests")
     config.addinivalue_line("markers", "tui: marks tests that require TUI components")
+    config.addinivalue_line("markers", "asyncio: marks coroutine tests run by pytest-asyncio")
+    config.addinivalue_line("markers", "xdist_group(name): keeps tests on one pytest-xdist worker")
+    config.addinivalue_line("markers", "stress: marks stress tests that only run with --run-stress")
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names and paths."""
+    skip_stress = pytest.mark.skip(reason="stress test; use --run-stress to run")
+    run_stress = config.getoption("--run-stress")
+    
     for item in items:
         # Add integration marker to integration test files
         if "test_integration" in item.fspath.basename:
@@ -54,14 +79,74 @@ def pytest_collection_modifyitems(config, items):
         # Add TUI marker to TUI-related tests
         if "tui" in item.name.lower() or "test_tui" in item.fspath.basename:
             item.add_marker(pytest.mark.tui)
+        
+        # Stress tests are opt-in
+        if "stress" in item.keywords and not run_stress:
+            item.add_marker(skip_stress)
 
 
 # Shared fixtures
 @pytest.fixture(scope="session")
-def temp_dir():
-    """Create a temporary directory for the test session."""
-    with tempfile.TemporaryDirectory(prefix="stablecam_test_") as temp_dir:
-        yield Path(temp_dir)
+def stress_scale(pytestconfig):
+    """Scale factor for stress test device counts, from --stress-scale."""
+    return pytestconfig.getoption("--stress-scale")
+
+
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory):
+    """
+    Create a temporary directory for the test session (one per pytest-xdist worker).
+    
+    Placed on tmpfs when /dev/shm is writable, keeping disk latency out of
+    registry I/O, and removed at the end of the session.
+    """
+    if os.access("/dev/shm", os.W_OK):
+        temp_dir = Path(tempfile.mkdtemp(prefix="stablecam_test-", dir="/dev/shm"))
+    else:
+        temp_dir = tmp_path_factory.mktemp("stablecam_test")
+    try:
+        yield temp_dir
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def installed_venv(tmp_path_factory):
+    """
+    Create a virtual environment with the package installed in editable mode.
+    
+    Built once per session (once per worker under pytest-xdist, each in its
+    own base temp directory); tests using it should be marked slow. The venv
+    is isolated from the runner's site-packages, so a full install also
+    checks that the declared dependencies resolve.
+    """
+    venv_dir = tmp_path_factory.mktemp("venv", numbered=True)
+    try:
+        venv.create(venv_dir, with_pip=True)
+        
+        if platform.system() == "Windows":
+            python_exe = venv_dir / "Scripts" / "python.exe"
+            pip_exe = venv_dir / "Scripts" / "pip.exe"
+        else:
+            python_exe = venv_dir / "bin" / "python"
+            pip_exe = venv_dir / "bin" / "pip"
+        
+        try:
+            result = subprocess.run(
+                [str(pip_exe), "install", "-e", str(project_root)],
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+        except subprocess.TimeoutExpired:
+            pytest.skip("Virtual environment installation timed out")
+        
+        if result.returncode != 0:
+            pytest.skip(f"Package installation failed: {result.stderr}")
+        
+        yield SimpleNamespace(python=python_exe, pip=pip_exe)
+    finally:
+        shutil.rmtree(venv_dir, ignore_errors=True)
 
 
 @pytest.fixture
@@ -74,6 +159,14 @@ def temp_registry_path(temp_dir):
         registry_path.unlink()
 
 
+@pytest.fixture
+def temp_registry(temp_dir):
+    """Create a unique registry file path inside the session temp directory."""
+    registry_path = temp_dir / f"registry-{uuid.uuid4().hex}.json"
+    yield registry_path
+    registry_path.unlink(missing_ok=True)
+
+
 @pytest.fixture
 def clean_registry(temp_registry_path):
     """Create a clean DeviceRegistry instance for testing."""
@@ -110,10 +203,44 @@ def sample_camera_no_serial():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_cameras():
+    """Create camera devices shared by the whole session; tests must not mutate them."""
+    return (
+        CameraDevice(
+            system_index=0,
+            vendor_id="046d",
+            product_id="085b", 
+            serial_number="ABC123456",
+            port_path="/dev/usb1/1-1",
+            label="Logitech C920 HD Pro Webcam",
+            platform_data={"udev_path": "/sys/devices/usb1/1-1"}
+        ),
+        CameraDevice(
+            system_index=1,
+            vendor_id="0c45",
+            product_id="6366",
+            serial_number="DEF789012",
+            port_path="/dev/usb1/1-2", 
+            label="Generic USB Camera",
+            platform_data={"udev_path": "/sys/devices/usb1/1-2"}
+        ),
+        CameraDevice(
+            system_index=2,
+            vendor_id="1234",
+            product_id="5678",
+            serial_number=None,  # No serial number
+            port_path="/dev/usb2/2-1",
+            label="No Serial Camera",
+            platform_data={"udev_path": "/sys/devices/usb2/2-1"}
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
 def multiple_camera_devices():
-    """Create multiple CameraDevice instances for testing."""
-    return [
+    """Create multiple CameraDevice instances shared by the whole session."""
+    return tuple(
         CameraDevice(
             system_index=i,
             vendor_id=f"{(0x1000 + i):04x}",
@@ -124,7 +251,7 @@ def multiple_camera_devices():
             platform_data={"test": True, "index": i}
         )
         for i in range(5)
-    ]
+    )
 
 
 @pytest.fixture
@@ -211,13 +338,49 @@ def patch_detector_with_mock_backend(mock_platform_backend):
         yield mock_detector
 
 
+class StubManager:
+    """Stub StableCam manager for tests that only need return values, not call assertions."""
+    
+    detector = None
+    
+    def __init__(self, devices=None):
+        self._devices = devices or []
+    
+    def list(self):
+        """Return the stubbed registered devices."""
+        return self._devices.copy()
+    
+    def detect(self):
+        """Return no detected devices."""
+        return []
+    
+    def on(self, event_type, callback):
+        """Accept an event subscription without recording it."""
+    
+    def run(self):
+        """Pretend to start monitoring."""
+    
+    def stop(self):
+        """Pretend to stop monitoring."""
+    
+    def set_devices(self, devices):
+        """Set the devices to return from list()."""
+        self._devices = devices.copy()
+
+
+@pytest.fixture
+def stub_manager():
+    """Create a stub StableCam manager with an empty registry."""
+    return StubManager()
+
+
 class EventTracker:
     """Utility class for tracking events in tests."""
     
     def __init__(self):
         self.events = []
         self.event_counts = {}
-        self.lock = threading.Lock()
+        self.lock = threading.Condition()
     
     def track_event(self, event_type):
         """Create an event handler that tracks events."""
@@ -231,6 +394,7 @@ class EventTracker:
                 }
                 self.events.append(event_data)
                 self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+                self.lock.notify_all()
         return handler
     
     def get_events(self, event_type=None):
@@ -245,6 +409,20 @@ class EventTracker:
         with self.lock:
             return self.event_counts.get(event_type, 0)
     
+    def get_latest_statuses(self):
+        """Get the most recently reported status for each stable ID."""
+        with self.lock:
+            return {e['stable_id']: e['status'] for e in self.events}
+    
+    def wait_for(self, predicate, timeout=2.0):
+        """Block until predicate() holds after an event, or the timeout expires."""
+        with self.lock:
+            return self.lock.wait_for(predicate, timeout)
+    
+    def wait_for_count(self, event_type, count, timeout=2.0):
+        """Block until at least count events of event_type have been tracked."""
+        return self.wait_for(lambda: self.event_counts.get(event_type, 0) >= count, timeout)
+    
     def clear(self):
         """Clear all tracked events."""
         with self.lock:
@@ -258,6 +436,56 @@ def event_tracker():
     return EventTracker()
 
 
+class FakeClock:
+    """
+    Test clock for the StableCam monitoring loop.
+    
+    Passed as ``StableCam(clock=...)`` it replaces the timed wait between polls,
+    so the loop only advances when the test calls ``tick_n``.
+    """
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending_ticks = 0
+        self._parked = False
+        self._stop_event = None
+    
+    def attach(self, manager):
+        """Wake the clock when the given manager is stopped."""
+        self._stop_event = manager._stop_event
+    
+    def __call__(self, timeout):
+        """Block the monitoring loop until the next tick or until stopped."""
+        with self._condition:
+            self._parked = True
+            self._condition.notify_all()
+            try:
+                while self._pending_ticks == 0:
+                    if self._stop_event is not None and self._stop_event.is_set():
+                        return True
+                    self._condition.wait(timeout=0.01)
+                self._pending_ticks -= 1
+                return False
+            finally:
+                self._parked = False
+    
+    def tick_n(self, n=1, timeout=5.0):
+        """Release n polls and wait until the loop is parked again."""
+        with self._condition:
+            self._pending_ticks += n
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self._parked and self._pending_ticks == 0,
+                timeout=timeout
+            )
+
+
+@pytest.fixture
+def fake_clock():
+    """Create a FakeClock instance for driving the monitoring loop."""
+    return FakeClock()
+
+
 class PerformanceTimer:
     """Utility class for timing operations in tests."""
     
@@ -355,6 +583,28 @@ skip_if_no_textual = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def platform_backends() -> Dict[str, type]:
+    """Import every platform backend once per session, keyed by platform name."""
+    backends = {}
+    try:
+        from stablecam.backends.linux import LinuxBackend
+        backends["linux"] = LinuxBackend
+    except ImportError:
+        pass
+    try:
+        from stablecam.backends.windows import WindowsBackend
+        backends["windows"] = WindowsBackend
+    except ImportError:
+        pass
+    try:
+        from stablecam.backends.macos import MacOSBackend
+        backends["darwin"] = MacOSBackend
+    except ImportError:
+        pass
+    return backends
+
+
 # Environment setup for tests
 @pytest.fixture(autouse=True)
 def setup_test_environment():
@@ -363,6 +613,8 @@ def setup_test_environment():
     original_env = os.environ.copy()
     os.environ["STABLECAM_TEST_MODE"] = "1"
     os.environ["STABLECAM_LOG_LEVEL"] = "WARNING"  # Reduce log noise in tests
+    # Test registries are throwaway files, so skip fsync unless a test asks for it
+    os.environ[DeviceRegistry.DURABILITY_ENV_VAR] = DeviceRegistry.DURABILITY_NONE
     
     yield
     
@@ -397,22 +649,41 @@ def memory_monitor():
         yield {'initial': 0, 'process': None}
 
 
+# Name prefix for worker threads of shared pools that deliberately outlive a test
+SHARED_POOL_THREAD_PREFIX = "stablecam-test-pool"
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Share a worker thread pool across the concurrency tests of a module."""
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix=SHARED_POOL_THREAD_PREFIX) as executor:
+        yield executor
+
+
 # Cleanup utilities
+def _count_test_threads():
+    """Count running threads, ignoring workers of shared test thread pools."""
+    return sum(
+        1 for thread in threading.enumerate()
+        if not thread.name.startswith(SHARED_POOL_THREAD_PREFIX)
+    )
+
+
 @pytest.fixture(autouse=True)
 def cleanup_threads():
     """Ensure no threads are left running after tests."""
-    initial_thread_count = threading.active_count()
+    initial_thread_count = _count_test_threads()
     
     yield
     
     # Wait a bit for threads to clean up
     time.sleep(0.1)
     
-    final_thread_count = threading.active_count()
+    final_thread_count = _count_test_threads()
     if final_thread_count > initial_thread_count:
         # Give threads more time to clean up
         time.sleep(0.5)
-        final_thread_count = threading.active_count()
+        final_thread_count = _count_test_threads()
         
         if final_thread_count > initial_thread_count:
             pytest.warns(
@@ -422,28 +693,34 @@ def cleanup_threads():
 
 
 # Test data generators
+# %-format templates for the generated test camera fields
+_HEX_ID_FMT = "%04x"
+_SERIAL_FMT = "%s%06d"
+_PORT_FMT = "/dev/video%d"
+
+
 @pytest.fixture
 def camera_factory():
-    """Factory function for creating test cameras."""
-    def _create_cameras(count=1, **kwargs):
-        defaults = {
-            'vendor_id': '046d',
-            'product_id': '085b',
-            'label': 'Factory Test Camera',
-            'platform_data': {'factory': True}
-        }
-        defaults.update(kwargs)
-        
-        cameras = []
-        for i in range(count):
-            camera_kwargs = defaults.copy()
-            camera_kwargs.update({
-                'system_index': i,
-                'serial_number': f"FACTORY{i:06d}" if 'serial_number' not in kwargs else kwargs['serial_number'],
-                'port_path': f"/dev/video{i}" if 'port_path' not in kwargs else kwargs['port_path'],
-            })
-            cameras.append(CameraDevice(**camera_kwargs))
-        
-        return cameras if count > 1 else cameras[0]
+    """
+    Factory for lists of distinct test cameras.
+    
+    Vendor/product IDs, serial and port are derived from each camera's index.
+    A given platform_data dict is shared by every camera in the list, so it
+    must not be mutated; without one, each camera gets its own test_index.
+    """
+    def _create_cameras(count, prefix="CAM", vid_base=0x1000, pid_base=0x2000,
+                        label="Test Camera", platform_data=None, start=0):
+        return [
+            CameraDevice(
+                system_index=i,
+                vendor_id=_HEX_ID_FMT % (vid_base + i),
+                product_id=_HEX_ID_FMT % (pid_base + i),
+                serial_number=_SERIAL_FMT % (prefix, i),
+                port_path=_PORT_FMT % i,
+                label="%s %d" % (label, i),
+                platform_data={"test_index": i} if platform_data is None else platform_data
+            )
+            for i in range(start, start + count)
+        ]
     
-    return _create_cameras
\ No newline at end of file
+    return _create_cameras
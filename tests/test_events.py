@@ -9,7 +9,7 @@ import pytest
 import threading
 import time
 from unittest.mock import Mock, patch
-from stablecam.events import EventManager, EventType
+from stablecam.events import EventManager, EventType, ALL_EVENTS
 
 
 class TestEventManager:
@@ -40,6 +40,26 @@ class TestEventManager:
         with pytest.raises(ValueError, match="Invalid event type 'invalid_event'"):
             self.event_manager.subscribe("invalid_event", callback)
     
+    def test_subscribe_all_events(self):
+        """Test that an ALL_EVENTS subscriber receives every event type once."""
+        callback = Mock()
+        self.event_manager.subscribe(ALL_EVENTS, callback)
+        assert self.event_manager.get_subscriber_count(ALL_EVENTS) == 1
+        
+        for event_type in EventType:
+            self.event_manager.emit(event_type.value, event_type.value)
+        
+        assert [c.args[0] for c in callback.call_args_list] == [e.value for e in EventType]
+        
+        self.event_manager.unsubscribe(ALL_EVENTS, callback)
+        self.event_manager.emit(EventType.ON_CONNECT.value, "data")
+        assert callback.call_count == len(EventType)
+    
+    def test_emit_all_events_type_raises_error(self):
+        """Test that ALL_EVENTS can be subscribed to but not emitted."""
+        with pytest.raises(ValueError, match="Invalid event type"):
+            self.event_manager.emit(ALL_EVENTS)
+    
     def test_subscribe_non_callable(self):
         """Test that subscribing non-callable raises TypeError."""
         with pytest.raises(TypeError, match="Callback must be callable"):
@@ -7,70 +7,71 @@ performance with multiple devices, and validate TUI functionality.
 """
 
 import pytest
-import tempfile
 import threading
 import time
 import asyncio
 import platform
-from pathlib import Path
+import random
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any
 
 from stablecam import StableCam, CameraDevice, RegisteredDevice, DeviceStatus
 from stablecam.registry import DeviceRegistry, RegistryError
-from stablecam.events import EventType
+from stablecam.events import EventType, ALL_EVENTS
+from stablecam.backends import DeviceDetector
 from stablecam.backends.exceptions import PlatformDetectionError
 
 
+# Monitoring interval for every StableCam built here; StableCam clamps
+# poll_interval to a 0.1s floor, so this is the fastest the loop can run
+TEST_POLL_INTERVAL = 0.1
+
+# Resolved once per session rather than in every platform test
+CURRENT_PLATFORM = platform.system().lower()
+
+# Platform-specific platform_data samples for test_platform_specific_device_data
+PLATFORM_DATA_SAMPLES = {
+    "linux": {
+        "udev_path": "/sys/devices/pci0000:00/0000:00:14.0/usb1/1-1",
+        "v4l2_caps": ["video_capture", "streaming"]
+    },
+    "windows": {
+        "device_path": "\\\\?\\usb#vid_046d&pid_085b#abc123456#{65e8773d-8f56-11d0-a3b9-00a0c9223196}",
+        "friendly_name": "Logitech HD Pro Webcam C920"
+    },
+    "darwin": {
+        "io_service_path": "IOService:/AppleACPIPlatformExpert/PCI0@0/AppleACPIPCI/XHC1@14/XHC1@14000000/HS01@14100000/USB Camera@14100000",
+        "av_device_id": "0x1a11000005ac8600"
+    }
+}
+
+# Device counts exercised by test_detection_performance_scaling, and the
+# detect() runs timed per count
+DETECTION_DEVICE_COUNTS = [1, 5, 10, 20, 50]
+DETECTION_TIMING_RUNS = 5
+
+# Formatted identifier strings for TestPerformanceMultiDevice.create_test_cameras,
+# built once at import rather than on every call
+_MAX_TEST_CAMERAS = 50
+_TEST_CAMERA_FIELDS = [
+    (
+        i,
+        f"{(0x1000 + i):04x}",
+        f"{(0x2000 + i):04x}",
+        f"SERIAL{i:06d}",
+        f"/dev/video{i}",
+        f"Test Camera {i}",
+    )
+    for i in range(_MAX_TEST_CAMERAS)
+]
+
+
 class TestEndToEndScenarios:
     """End-to-end integration tests simulating real device connection scenarios."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        registry_path.unlink()  # Remove empty file
-        yield registry_path
-        if registry_path.exists():
-            registry_path.unlink()
-    
-    @pytest.fixture
-    def sample_cameras(self):
-        """Create sample camera devices for testing."""
-        return [
-            CameraDevice(
-                system_index=0,
-                vendor_id="046d",
-                product_id="085b", 
-                serial_number="ABC123456",
-                port_path="/dev/usb1/1-1",
-                label="Logitech C920 HD Pro Webcam",
-                platform_data={"udev_path": "/sys/devices/usb1/1-1"}
-            ),
-            CameraDevice(
-                system_index=1,
-                vendor_id="0c45",
-                product_id="6366",
-                serial_number="DEF789012",
-                port_path="/dev/usb1/1-2", 
-                label="Generic USB Camera",
-                platform_data={"udev_path": "/sys/devices/usb1/1-2"}
-            ),
-            CameraDevice(
-                system_index=2,
-                vendor_id="1234",
-                product_id="5678",
-                serial_number=None,  # No serial number
-                port_path="/dev/usb2/2-1",
-                label="No Serial Camera",
-                platform_data={"udev_path": "/sys/devices/usb2/2-1"}
-            )
-        ]
-    
     @pytest.mark.integration
-    def test_complete_device_lifecycle(self, temp_registry, sample_cameras):
+    def test_complete_device_lifecycle(self, temp_registry, sample_cameras, fake_clock):
         """Test complete device lifecycle from detection to monitoring."""
         events_received = []
         
@@ -82,11 +83,11 @@ class TestEndToEndScenarios:
                 'timestamp': datetime.now()
             })
         
-        with StableCam(registry_path=temp_registry, poll_interval=0.1) as manager:
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL, clock=fake_clock) as manager:
+            fake_clock.attach(manager)
+            
             # Subscribe to all events
-            manager.on(EventType.ON_CONNECT.value, track_events)
-            manager.on(EventType.ON_DISCONNECT.value, track_events)
-            manager.on(EventType.ON_STATUS_CHANGE.value, track_events)
+            manager.on(ALL_EVENTS, track_events)
             
             # Phase 1: Initial detection and registration
             with patch.object(manager.detector, 'detect_cameras', return_value=sample_cameras[:2]):
@@ -108,11 +109,11 @@ class TestEndToEndScenarios:
             
             # Phase 2: Start monitoring
             manager.run()
-            time.sleep(0.2)  # Let monitoring loop run
+            assert fake_clock.tick_n(0)  # Let the first monitoring pass run
             
             # Phase 3: Simulate device disconnection
             with patch.object(manager.detector, 'detect_cameras', return_value=[sample_cameras[1]]):
-                time.sleep(0.2)  # Wait for monitoring to detect change
+                assert fake_clock.tick_n(1)  # Run one poll to detect the change
             
             # Verify disconnection was detected
             devices = manager.list()
@@ -135,7 +136,7 @@ class TestEndToEndScenarios:
             
             with patch.object(manager.detector, 'detect_cameras', 
                             return_value=[sample_cameras[1], reconnected_camera]):
-                time.sleep(0.2)  # Wait for monitoring to detect change
+                assert fake_clock.tick_n(1)  # Run one poll to detect the change
             
             # Verify reconnection with updated system index
             device1 = manager.get_by_id(id1)
@@ -149,7 +150,7 @@ class TestEndToEndScenarios:
                 id3 = manager.register(sample_cameras[2])
                 assert id3 == "stable-cam-003"
                 
-                time.sleep(0.2)  # Let monitoring process
+                assert fake_clock.tick_n(1)  # Let monitoring process
             
             # Verify all devices are tracked
             devices = manager.list()
@@ -169,61 +170,52 @@ class TestEndToEndScenarios:
     def test_registry_persistence_across_restarts(self, temp_registry, sample_cameras):
         """Test that device registry persists across application restarts."""
         # First session: register devices
-        with StableCam(registry_path=temp_registry) as manager1:
-            with patch.object(manager1.detector, 'detect_cameras', return_value=sample_cameras):
-                id1 = manager1.register(sample_cameras[0])
-                id2 = manager1.register(sample_cameras[1])
-                
-                devices = manager1.list()
-                assert len(devices) == 2
+        registry1 = DeviceRegistry(temp_registry)
+        id1 = registry1.register(sample_cameras[0])
+        id2 = registry1.register(sample_cameras[1])
+        
+        devices = registry1.get_all()
+        assert len(devices) == 2
         
         # Second session: verify persistence
-        with StableCam(registry_path=temp_registry) as manager2:
-            devices = manager2.list()
-            assert len(devices) == 2
-            
-            # Verify stable IDs are preserved
-            stable_ids = {d.stable_id for d in devices}
-            assert id1 in stable_ids
-            assert id2 in stable_ids
-            
-            # Verify device details are preserved
-            device1 = manager2.get_by_id(id1)
-            assert device1.device_info.vendor_id == sample_cameras[0].vendor_id
-            assert device1.device_info.serial_number == sample_cameras[0].serial_number
+        registry2 = DeviceRegistry(temp_registry)
+        devices = registry2.get_all()
+        assert len(devices) == 2
+        
+        # Verify stable IDs are preserved
+        stable_ids = {d.stable_id for d in devices}
+        assert id1 in stable_ids
+        assert id2 in stable_ids
+        
+        # Verify device details are preserved
+        device1 = registry2.get_by_id(id1)
+        assert device1.device_info.vendor_id == sample_cameras[0].vendor_id
+        assert device1.device_info.serial_number == sample_cameras[0].serial_number
     
     @pytest.mark.integration
-    def test_concurrent_access_safety(self, temp_registry, sample_cameras):
+    @pytest.mark.parametrize("backend", [DeviceRegistry.BACKEND_FILE, DeviceRegistry.BACKEND_MEMORY])
+    def test_concurrent_access_safety(self, temp_registry, sample_cameras, monkeypatch, thread_pool, backend):
         """Test that multiple StableCam instances can safely access the same registry."""
-        results = {}
-        errors = []
+        monkeypatch.setenv(DeviceRegistry.BACKEND_ENV_VAR, backend)
+        # File-backed instances stand in for separate processes, so lock with flock()
+        monkeypatch.setenv(DeviceRegistry.MULTIPROCESS_ENV_VAR, "1")
+        monkeypatch.setattr(DeviceRegistry, "_memory_stores", {})
+        monkeypatch.setattr(DeviceRegistry, "_memory_locks", {})
         
-        def worker(worker_id, camera):
-            try:
-                with StableCam(registry_path=temp_registry) as manager:
-                    with patch.object(manager.detector, 'detect_cameras', return_value=[camera]):
-                        stable_id = manager.register(camera)
-                        results[worker_id] = stable_id
-                        time.sleep(0.1)  # Simulate some work
-            except Exception as e:
-                errors.append(f"Worker {worker_id}: {e}")
-        
-        # Start multiple workers concurrently
-        threads = []
-        for i, camera in enumerate(sample_cameras):
-            thread = threading.Thread(target=worker, args=(i, camera))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all workers to complete
-        for thread in threads:
-            thread.join(timeout=5.0)
-        
-        # Verify no errors occurred
-        assert len(errors) == 0, f"Concurrent access errors: {errors}"
-        
-        # Verify all devices were registered
-        assert len(results) == len(sample_cameras)
+        # Release every worker's registration at once so they contend for the registry
+        start = threading.Barrier(len(sample_cameras))
+        
+        def worker(camera):
+            with StableCam(registry_path=temp_registry) as manager:
+                with patch.object(manager.detector, 'detect_cameras', return_value=[camera]):
+                    start.wait(timeout=2.0)
+                    return manager.register(camera)
+        
+        # Run the workers concurrently; any worker exception is re-raised here
+        results = list(thread_pool.map(worker, sample_cameras, timeout=2.0))
+        
+        # Verify all devices were registered with distinct IDs
+        assert len(set(results)) == len(sample_cameras)
         
         # Verify final registry state
         with StableCam(registry_path=temp_registry) as manager:
@@ -231,15 +223,17 @@ class TestEndToEndScenarios:
             assert len(devices) == len(sample_cameras)
     
     @pytest.mark.integration
-    def test_error_recovery_scenarios(self, temp_registry, sample_cameras):
+    def test_error_recovery_scenarios(self, temp_registry, sample_cameras, fake_clock):
         """Test system recovery from various error conditions."""
-        with StableCam(registry_path=temp_registry, poll_interval=0.1) as manager:
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL, clock=fake_clock) as manager:
+            fake_clock.attach(manager)
+            
             # Register initial device
             with patch.object(manager.detector, 'detect_cameras', return_value=[sample_cameras[0]]):
                 stable_id = manager.register(sample_cameras[0])
             
             manager.run()
-            time.sleep(0.1)
+            assert fake_clock.tick_n(0)
             
             # Simulate detection errors
             error_count = 0
@@ -253,7 +247,7 @@ class TestEndToEndScenarios:
                 return [sample_cameras[0]]  # Then succeed
             
             with patch.object(manager.detector, 'detect_cameras', side_effect=failing_detect):
-                time.sleep(0.3)  # Let monitoring handle errors
+                assert fake_clock.tick_n(3)  # Two failing polls, then one that succeeds
             
             # Verify system recovered
             assert manager._monitoring  # Should still be monitoring
@@ -267,57 +261,26 @@ class TestEndToEndScenarios:
 class TestCrossPlatformCompatibility:
     """Tests for cross-platform compatibility and platform-specific behavior."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        registry_path.unlink()
-        yield registry_path
-        if registry_path.exists():
-            registry_path.unlink()
-    
     @pytest.mark.integration
-    def test_platform_backend_selection(self, temp_registry):
+    def test_platform_backend_selection(self, platform_backends):
         """Test that correct platform backend is selected based on current OS."""
-        with StableCam(registry_path=temp_registry) as manager:
-            backend = manager.detector.get_platform_backend()
-            current_platform = platform.system().lower()
-            
-            if current_platform == "linux":
-                from stablecam.backends.linux import LinuxBackend
-                assert isinstance(backend, LinuxBackend)
-            elif current_platform == "windows":
-                from stablecam.backends.windows import WindowsBackend
-                assert isinstance(backend, WindowsBackend)
-            elif current_platform == "darwin":
-                from stablecam.backends.macos import MacOSBackend
-                assert isinstance(backend, MacOSBackend)
+        backend = DeviceDetector().get_platform_backend()
+        
+        if CURRENT_PLATFORM in platform_backends:
+            assert isinstance(backend, platform_backends[CURRENT_PLATFORM])
     
     @pytest.mark.integration
-    @pytest.mark.parametrize("platform_name,expected_backend", [
-        ("linux", "LinuxBackend"),
-        ("windows", "WindowsBackend"), 
-        ("darwin", "MacOSBackend"),
+    @pytest.mark.parametrize("platform_name,expected_backend,platform_data", [
+        pytest.param(name, backend, PLATFORM_DATA_SAMPLES[name], id=name)
+        for name, backend in [
+            ("linux", "LinuxBackend"),
+            ("windows", "WindowsBackend"),
+            ("darwin", "MacOSBackend"),
+        ]
     ])
-    def test_platform_specific_device_data(self, temp_registry, platform_name, expected_backend):
+    def test_platform_specific_device_data(self, temp_registry, platform_name, expected_backend,
+                                           platform_data):
         """Test that platform-specific device data is handled correctly."""
-        # Create platform-specific test data
-        platform_data_samples = {
-            "linux": {
-                "udev_path": "/sys/devices/pci0000:00/0000:00:14.0/usb1/1-1",
-                "v4l2_caps": ["video_capture", "streaming"]
-            },
-            "windows": {
-                "device_path": "\\\\?\\usb#vid_046d&pid_085b#abc123456#{65e8773d-8f56-11d0-a3b9-00a0c9223196}",
-                "friendly_name": "Logitech HD Pro Webcam C920"
-            },
-            "darwin": {
-                "io_service_path": "IOService:/AppleACPIPlatformExpert/PCI0@0/AppleACPIPCI/XHC1@14/XHC1@14000000/HS01@14100000/USB Camera@14100000",
-                "av_device_id": "0x1a11000005ac8600"
-            }
-        }
-        
         test_camera = CameraDevice(
             system_index=0,
             vendor_id="046d",
@@ -325,17 +288,15 @@ class TestCrossPlatformCompatibility:
             serial_number="ABC123456",
             port_path="/dev/video0" if platform_name == "linux" else "USB\\VID_046D&PID_085B\\ABC123456",
             label="Test Camera",
-            platform_data=platform_data_samples[platform_name]
+            platform_data=platform_data
         )
         
-        with StableCam(registry_path=temp_registry) as manager:
-            # Mock the backend to return our test data
-            with patch.object(manager.detector, 'detect_cameras', return_value=[test_camera]):
-                stable_id = manager.register(test_camera)
-                
-                # Verify platform data is preserved
-                registered_device = manager.get_by_id(stable_id)
-                assert registered_device.device_info.platform_data == platform_data_samples[platform_name]
+        registry = DeviceRegistry(temp_registry)
+        stable_id = registry.register(test_camera)
+        
+        # Verify platform data is preserved
+        registered_device = registry.get_by_id(stable_id)
+        assert registered_device.device_info.platform_data == platform_data
     
     @pytest.mark.integration
     def test_hardware_id_generation_consistency(self, temp_registry):
@@ -362,81 +323,98 @@ class TestCrossPlatformCompatibility:
             )
         ]
         
-        with StableCam(registry_path=temp_registry) as manager:
-            stable_ids = []
-            
-            for camera in test_cases:
-                with patch.object(manager.detector, 'detect_cameras', return_value=[camera]):
-                    stable_id = manager.register(camera)
-                    stable_ids.append(stable_id)
-            
-            # Verify all devices got unique stable IDs
-            assert len(set(stable_ids)) == len(stable_ids)
-            
-            # Verify hardware ID generation is deterministic
-            for i, camera in enumerate(test_cases):
-                hw_id1 = camera.generate_hardware_id()
-                hw_id2 = camera.generate_hardware_id()
-                assert hw_id1 == hw_id2, f"Hardware ID generation not deterministic for camera {i}"
+        registry = DeviceRegistry(temp_registry)
+        stable_ids = [registry.register(camera) for camera in test_cases]
+        
+        # Verify all devices got unique stable IDs
+        assert len(set(stable_ids)) == len(stable_ids)
+        
+        # Verify hardware ID generation is deterministic
+        for i, camera in enumerate(test_cases):
+            hw_id1 = camera.generate_hardware_id()
+            hw_id2 = camera.generate_hardware_id()
+            assert hw_id1 == hw_id2, f"Hardware ID generation not deterministic for camera {i}"
+
+
+@pytest.fixture(scope="module")
+def scaling_manager(tmp_path_factory):
+    """Share one StableCam across the detection scaling sizes."""
+    registry_path = tmp_path_factory.mktemp("scaling") / "registry.json"
+    with StableCam(registry_path=registry_path) as manager:
+        yield manager
+
+
+@pytest.fixture(scope="module")
+def scaling_cameras():
+    """Build the largest camera list once; each size uses a slice of it."""
+    return TestPerformanceMultiDevice.create_test_cameras(max(DETECTION_DEVICE_COUNTS))
+
+
+@pytest.fixture(scope="module")
+def detection_times():
+    """Collect detection times per device count for the scaling check."""
+    return {}
 
 
 class TestPerformanceMultiDevice:
     """Performance tests for multi-device detection and monitoring."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        registry_path.unlink()
-        yield registry_path
-        if registry_path.exists():
-            registry_path.unlink()
-    
-    def create_test_cameras(self, count: int) -> List[CameraDevice]:
+    @staticmethod
+    def create_test_cameras(count: int) -> List[CameraDevice]:
         """Create a list of test camera devices."""
-        cameras = []
-        for i in range(count):
-            cameras.append(CameraDevice(
+        assert count <= _MAX_TEST_CAMERAS, f"Raise _MAX_TEST_CAMERAS to create {count} cameras"
+        return [
+            CameraDevice(
                 system_index=i,
-                vendor_id=f"{(0x1000 + i):04x}",
-                product_id=f"{(0x2000 + i):04x}",
-                serial_number=f"SERIAL{i:06d}",
-                port_path=f"/dev/video{i}",
-                label=f"Test Camera {i}",
+                vendor_id=vendor_id,
+                product_id=product_id,
+                serial_number=serial_number,
+                port_path=port_path,
+                label=label,
                 platform_data={"test_id": i}
-            ))
-        return cameras
+            )
+            for i, vendor_id, product_id, serial_number, port_path, label
+            in _TEST_CAMERA_FIELDS[:count]
+        ]
     
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_detection_performance_scaling(self, temp_registry):
+    @pytest.mark.parametrize("count", DETECTION_DEVICE_COUNTS)
+    @pytest.mark.xdist_group("detection_scaling")
+    def test_detection_performance_scaling(self, scaling_manager, scaling_cameras,
+                                           detection_times, count):
         """Test detection performance with increasing number of devices."""
-        device_counts = [1, 5, 10, 20, 50]
-        detection_times = {}
+        manager = scaling_manager
+        cameras = scaling_cameras[:count]
+        
+        # Measure detection time, keeping the best of a few runs so a single
+        # scheduler or GC pause doesn't skew the cross-size ratio
+        detection_time = float("inf")
+        with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
+            for _ in range(DETECTION_TIMING_RUNS):
+                start_time = time.time()
+                detected = manager.detect()
+                detection_time = min(detection_time, time.time() - start_time)
         
-        with StableCam(registry_path=temp_registry) as manager:
-            for count in device_counts:
-                cameras = self.create_test_cameras(count)
-                
-                # Measure detection time
-                with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
-                    start_time = time.time()
-                    detected = manager.detect()
-                    detection_time = time.time() - start_time
-                    
-                    detection_times[count] = detection_time
-                    assert len(detected) == count
-                    
-                    # Detection should complete within reasonable time
-                    assert detection_time < 1.0, f"Detection took {detection_time:.3f}s for {count} devices"
+        detection_times[count] = detection_time
+        assert len(detected) == count
+        
+        # Detection should complete within reasonable time
+        assert detection_time < 1.0, f"Detection took {detection_time:.3f}s for {count} devices"
+    
+    @pytest.mark.integration
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("detection_scaling")
+    def test_detection_performance_degradation(self, detection_times):
+        """Test that detection doesn't degrade significantly with more devices."""
+        if len(detection_times) < len(DETECTION_DEVICE_COUNTS):
+            pytest.skip("Requires every test_detection_performance_scaling size in this session")
         
         # Verify performance doesn't degrade significantly with more devices
         # (This is a basic check - real performance will depend on platform backend)
-        if len(detection_times) > 1:
-            times = list(detection_times.values())
-            # Performance shouldn't degrade more than 10x from smallest to largest
-            assert max(times) / min(times) < 10.0
+        times = list(detection_times.values())
+        # Performance shouldn't degrade more than 10x from smallest to largest
+        assert max(times) / min(times) < 10.0
     
     @pytest.mark.integration
     @pytest.mark.slow
@@ -469,6 +447,7 @@ class TestPerformanceMultiDevice:
                 assert len(devices) == camera_count
     
     @pytest.mark.integration
+    @pytest.mark.xdist_group("monitor")
     @pytest.mark.slow
     def test_monitoring_performance_many_devices(self, temp_registry):
         """Test monitoring loop performance with many devices."""
@@ -477,7 +456,7 @@ class TestPerformanceMultiDevice:
         
         monitoring_times = []
         
-        with StableCam(registry_path=temp_registry, poll_interval=0.1) as manager:
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL) as manager:
             # Register all devices
             with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
                 for camera in cameras:
@@ -493,7 +472,7 @@ class TestPerformanceMultiDevice:
             
             with patch.object(manager.detector, 'detect_cameras', side_effect=timed_detect):
                 manager.run()
-                time.sleep(1.0)  # Let monitoring run for 1 second
+                time.sleep(TEST_POLL_INTERVAL * 10)  # Let monitoring run for ten polls
                 manager.stop()
             
             # Verify monitoring performance
@@ -508,13 +487,12 @@ class TestPerformanceMultiDevice:
     @pytest.mark.integration
     def test_memory_usage_stability(self, temp_registry):
         """Test that memory usage remains stable during extended monitoring."""
-        import gc
-        import sys
+        import tracemalloc
         
         camera_count = 10
         cameras = self.create_test_cameras(camera_count)
         
-        with StableCam(registry_path=temp_registry, poll_interval=0.05) as manager:
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL) as manager:
             # Register devices
             with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
                 for camera in cameras:
@@ -523,25 +501,27 @@ class TestPerformanceMultiDevice:
             # Start monitoring and measure memory usage
             manager.run()
             
-            # Force garbage collection and get initial memory usage
-            gc.collect()
-            initial_objects = len(gc.get_objects())
-            
-            # Run monitoring for a while
-            time.sleep(0.5)
-            
-            # Check memory usage again
-            gc.collect()
-            final_objects = len(gc.get_objects())
-            
-            manager.stop()
+            # Trace allocations from here on and snapshot the baseline
+            tracemalloc.start()
+            try:
+                initial_snapshot = tracemalloc.take_snapshot()
+                
+                # Run monitoring for a while
+                time.sleep(TEST_POLL_INTERVAL * 5)
+                
+                # Check memory usage again
+                final_snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+                manager.stop()
             
             # Memory usage shouldn't grow significantly
-            object_growth = final_objects - initial_objects
-            growth_percentage = (object_growth / initial_objects) * 100
+            initial_bytes = sum(stat.size for stat in initial_snapshot.statistics('filename'))
+            final_bytes = sum(stat.size for stat in final_snapshot.statistics('filename'))
+            byte_growth = final_bytes - initial_bytes
             
             # Allow some growth but not excessive
-            assert growth_percentage < 50, f"Memory usage grew by {growth_percentage:.1f}%"
+            assert byte_growth < 1024 * 1024, f"Memory usage grew by {byte_growth / 1024:.1f} KiB"
 
 
 # TUI Integration Tests
@@ -558,16 +538,6 @@ except ImportError:
 class TestTUIIntegration:
     """Integration tests for TUI functionality using Textual testing framework."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        registry_path.unlink()
-        yield registry_path
-        if registry_path.exists():
-            registry_path.unlink()
-    
     @pytest.fixture
     def sample_devices(self):
         """Create sample registered devices for TUI testing."""
@@ -596,68 +566,67 @@ class TestTUIIntegration:
             )
         ]
     
+    @pytest.fixture
+    def mock_manager(self, mock_stablecam_manager):
+        """Create a mock StableCam manager with an empty registry."""
+        return mock_stablecam_manager
+    
     @pytest.mark.integration
-    def test_tui_initialization_and_mount(self, temp_registry):
+    @pytest.mark.asyncio
+    async def test_tui_initialization_and_mount(self, temp_registry, mock_manager):
         """Test TUI initialization and mounting process."""
         app = StableCamTUI(registry_path=temp_registry)
+        assert app.registry_path == temp_registry
+        assert app.manager is None  # Not initialized until mount
         
-        # Mock the StableCam manager
-        mock_manager = Mock()
-        mock_manager.list.return_value = []
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
+        with patch('stablecam.tui.StableCam', return_value=mock_manager) as mock_stablecam_class:
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                
+                # Mount created the manager, subscribed to events and started monitoring
+                assert app.manager is mock_manager
+                assert mock_manager.on.call_count == 3
+                mock_manager.run.assert_called_once()
+                assert app.update_timer is not None
         
-        with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            # Test that app can be created and mounted
-            assert app.registry_path == temp_registry
-            assert app.manager is None  # Not initialized until mount
-            
-            # Simulate mount by calling the sync parts
-            # We can't easily test the async mount without running the app
-            # So we'll test the initialization logic directly
-            app.manager = mock_manager
-            
-            # Verify manager was set
-            assert app.manager is not None
+        mock_stablecam_class.assert_called_once_with(registry_path=temp_registry)
     
     @pytest.mark.integration
-    def test_tui_device_display_and_updates(self, temp_registry, sample_devices):
+    @pytest.mark.asyncio
+    async def test_tui_device_display_and_updates(self, temp_registry, stub_manager, sample_devices):
         """Test TUI device display and real-time updates."""
         app = StableCamTUI(registry_path=temp_registry)
+        stub_manager.set_devices(sample_devices)
         
-        # Mock manager with sample devices
-        mock_manager = Mock()
-        mock_manager.list.return_value = sample_devices
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
-        
-        with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            app.manager = mock_manager
-            
-            # Simulate device loading (sync version)
-            app.devices = sample_devices
-            app.device_count = len(sample_devices)
-            app.connected_count = sum(1 for d in sample_devices if d.status == DeviceStatus.CONNECTED)
-            
-            # Verify devices were loaded
-            assert len(app.devices) == 2
-            assert app.device_count == 2
-            assert app.connected_count == 1  # Only one connected
-            
-            # Test status display formatting
-            connected_device = sample_devices[0]
-            disconnected_device = sample_devices[1]
-            
-            indicator1, css1 = app._get_status_display(connected_device)
-            assert indicator1 == "● Online"
-            assert css1 == "connected"
-            
-            indicator2, css2 = app._get_status_display(disconnected_device)
-            assert indicator2 == "○ Offline"
-            assert css2 == "disconnected"
+        with patch('stablecam.tui.StableCam', return_value=stub_manager):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                
+                # Verify devices were loaded by the initial refresh
+                assert len(app.devices) == 2
+                assert app.device_count == 2
+                assert app.connected_count == 1  # Only one connected
+                assert app.query_one("#device-table", DataTable).row_count == 2
+                
+                # Refresh picks up changes from the manager
+                stub_manager.set_devices(sample_devices[:1])
+                await pilot.press("r")
+                await pilot.pause()
+                assert app.device_count == 1
+                assert app.query_one("#device-table", DataTable).row_count == 1
+        
+        # Test status display formatting
+        indicator1, css1 = app._get_status_display(sample_devices[0])
+        assert indicator1 == "● Online"
+        assert css1 == "connected"
+        
+        indicator2, css2 = app._get_status_display(sample_devices[1])
+        assert indicator2 == "○ Offline"
+        assert css2 == "disconnected"
     
     @pytest.mark.integration
-    def test_tui_device_registration_flow(self, temp_registry):
+    @pytest.mark.asyncio
+    async def test_tui_device_registration_flow(self, temp_registry, mock_manager):
         """Test TUI device registration workflow."""
         app = StableCamTUI(registry_path=temp_registry)
         
@@ -667,104 +636,78 @@ class TestTUIIntegration:
             serial_number="NEW123", port_path="/dev/video2",
             label="New Camera", platform_data={}
         )
-        
-        # Mock manager
-        mock_manager = Mock()
-        mock_manager.list.return_value = []  # No existing devices
         mock_manager.detect.return_value = [new_device]
         mock_manager.register.return_value = "stable-cam-001"
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
         
         with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            app.manager = mock_manager
-            app.devices = []  # No existing devices
-            
-            # Test registration logic (sync version)
-            detected_devices = mock_manager.detect()
-            unregistered = [d for d in detected_devices if not any(
-                rd.device_info.generate_hardware_id() == d.generate_hardware_id() 
-                for rd in app.devices
-            )]
-            
-            if unregistered:
-                stable_id = mock_manager.register(unregistered[0])
-                assert stable_id == "stable-cam-001"
-            
-            # Verify registration was attempted
-            mock_manager.detect.assert_called_once()
-            mock_manager.register.assert_called_once_with(new_device)
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                
+                # Register through the key binding
+                await pilot.press("n")
+                await pilot.pause()
+        
+        # Verify registration was attempted
+        mock_manager.detect.assert_called_once()
+        mock_manager.register.assert_called_once_with(new_device)
     
     @pytest.mark.integration
-    def test_tui_event_handling_and_visual_updates(self, temp_registry, sample_devices):
+    @pytest.mark.asyncio
+    async def test_tui_event_handling_and_visual_updates(self, temp_registry, stub_manager,
+                                                         sample_devices):
         """Test TUI event handling and visual update indicators."""
         app = StableCamTUI(registry_path=temp_registry)
+        stub_manager.set_devices(sample_devices)
         
-        mock_manager = Mock()
-        mock_manager.list.return_value = sample_devices
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
-        
-        with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            app.manager = mock_manager
-            
-            device = sample_devices[0]
-            stable_id = device.stable_id
-            
-            # Test event handlers
-            app._on_device_connect(device)
-            assert app._is_recent_change(stable_id)
-            
-            app._on_device_disconnect(device)
-            assert app._is_recent_change(stable_id)
-            
-            app._on_device_status_change(device)
-            assert app._is_recent_change(stable_id)
-            
-            # Test recent change tracking with time
-            with patch('stablecam.tui.datetime') as mock_datetime:
-                # Simulate time passing
-                original_time = app._recent_changes[stable_id]
-                future_time = original_time + timedelta(seconds=6)
-                mock_datetime.now.return_value = future_time
+        with patch('stablecam.tui.StableCam', return_value=stub_manager):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                
+                device = sample_devices[0]
+                stable_id = device.stable_id
                 
-                # Should no longer be recent
-                assert not app._is_recent_change(stable_id)
+                # Test event handlers
+                app._on_device_connect(device)
+                assert app._is_recent_change(stable_id)
+                
+                app._on_device_disconnect(device)
+                assert app._is_recent_change(stable_id)
+                
+                app._on_device_status_change(device)
+                assert app._is_recent_change(stable_id)
+        
+        # Test recent change tracking with time
+        original_time = app._recent_changes[stable_id]
+        with patch('stablecam.tui.time.monotonic', return_value=original_time + 6):
+            # Should no longer be recent
+            assert not app._is_recent_change(stable_id)
     
     @pytest.mark.integration
-    def test_tui_error_handling_and_recovery(self, temp_registry):
+    @pytest.mark.asyncio
+    async def test_tui_error_handling_and_recovery(self, temp_registry, mock_manager):
         """Test TUI error handling and recovery scenarios."""
         app = StableCamTUI(registry_path=temp_registry)
         
         # Mock manager that raises errors
-        mock_manager = Mock()
         mock_manager.list.side_effect = Exception("Registry error")
         mock_manager.detect.side_effect = Exception("Detection error")
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
+        
+        # Capture status messages
+        app._update_status = Mock()
         
         with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            app.manager = mock_manager
-            
-            # Mock status update to capture error messages
-            app._update_status = Mock()
-            
-            # Test error handling in device listing
-            try:
-                devices = app.manager.list()
-            except Exception:
-                # Should handle error gracefully
-                app._update_status("Error loading devices")
-            
-            # Test error handling in detection
-            try:
-                detected = app.manager.detect()
-            except Exception:
-                # Should handle detection error gracefully
-                app._update_status("Error detecting devices")
-            
-            # Verify error handling was called
-            assert app._update_status.call_count >= 1
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                
+                # Refresh failure is reported and leaves the device list empty
+                assert app.devices == []
+                app._update_status.assert_any_call("Refresh error: Registry error")
+                
+                # Detection failure is reported instead of crashing the app
+                await pilot.press("n")
+                await pilot.pause()
+                app._update_status.assert_any_call("Registration error: Detection error")
+                assert app.is_running
     
     @pytest.mark.integration
     def test_tui_run_function_integration(self, temp_registry):
@@ -781,168 +724,164 @@ class TestTUIIntegration:
             mock_app.run.assert_called_once()
     
     @pytest.mark.integration
-    def test_tui_cleanup_on_unmount(self, temp_registry):
+    @pytest.mark.asyncio
+    async def test_tui_cleanup_on_unmount(self, temp_registry, mock_manager):
         """Test proper TUI cleanup when unmounting."""
         app = StableCamTUI(registry_path=temp_registry)
         
-        mock_manager = Mock()
-        mock_manager.list.return_value = []
-        mock_manager.on.return_value = None
-        mock_manager.run.return_value = None
-        mock_manager.stop.return_value = None
-        
         with patch('stablecam.tui.StableCam', return_value=mock_manager):
-            app.manager = mock_manager
-            
-            # Set up mock timer
-            mock_timer = Mock()
-            app.update_timer = mock_timer
-            
-            # Test cleanup logic (sync version)
-            if hasattr(app, 'update_timer') and app.update_timer:
-                app.update_timer.stop()
-            if app.manager:
-                app.manager.stop()
-            
-            # Verify cleanup was performed
-            mock_timer.stop.assert_called_once()
-            mock_manager.stop.assert_called_once()
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                mock_manager.stop.assert_not_called()
+        
+        # Leaving the pilot session unmounts the app, which stops monitoring
+        mock_manager.stop.assert_called_once()
+
+
+# Connection patterns for test_full_system_workflow_with_events, as indexes
+# into sample_cameras
+WORKFLOW_SCENARIOS = [
+    [0, 1, 2],  # All devices connected
+    [1, 2],     # One device disconnected
+    [0],        # Two devices disconnected
+    [],         # All devices disconnected
+    [2, 0],     # Devices reconnect in different order
+    [0, 1, 2],  # All devices back
+]
+
+
+def _generate_stress_scenarios(camera_count: int, changes: int, seed: int = 42) -> tuple:
+    """Generate a reproducible sequence of connected camera index subsets."""
+    rng = random.Random(seed)
+    return tuple(
+        tuple(rng.sample(range(camera_count), rng.randint(0, camera_count)))
+        for _ in range(changes)
+    )
+
+
+# Connection patterns for test_stress_test_rapid_changes, as indexes into
+# multiple_camera_devices; generated once at import rather than per run
+_STRESS_CAMERA_COUNT = 5
+STRESS_SCENARIOS = _generate_stress_scenarios(_STRESS_CAMERA_COUNT, changes=20)
+
+
+@pytest.fixture(scope="module")
+def workflow_manager(tmp_path_factory, sample_cameras):
+    """Share one StableCam with sample_cameras registered across the workflow scenarios."""
+    registry_path = tmp_path_factory.mktemp("workflow") / "registry.json"
+    with StableCam(registry_path=registry_path, poll_interval=TEST_POLL_INTERVAL) as manager, \
+            patch.object(manager.detector, 'detect_cameras', return_value=list(sample_cameras)) as mock_detect:
+        stable_ids = [manager.register(camera) for camera in sample_cameras]
+        yield manager, mock_detect, stable_ids
 
 
 class TestSystemIntegration:
     """System-level integration tests combining multiple components."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        registry_path.unlink()
-        yield registry_path
-        if registry_path.exists():
-            registry_path.unlink()
-    
     @pytest.mark.integration
-    def test_full_system_workflow_with_events(self, temp_registry):
+    @pytest.mark.xdist_group("monitor")
+    @pytest.mark.parametrize("scenario_idx", range(len(WORKFLOW_SCENARIOS)))
+    def test_full_system_workflow_with_events(self, workflow_manager, event_tracker, sample_cameras,
+                                              scenario_idx):
         """Test complete system workflow with event propagation."""
-        # Track all system events
-        system_events = []
-        
-        def event_logger(event_type):
-            def handler(device):
-                system_events.append({
-                    'type': event_type,
-                    'stable_id': device.stable_id,
-                    'status': device.status,
-                    'timestamp': datetime.now()
-                })
-            return handler
-        
-        # Create test scenario with multiple devices
-        cameras = [
-            CameraDevice(0, "046d", "085b", "ABC123", "/dev/video0", "Camera 1", {}),
-            CameraDevice(1, "0c45", "6366", "DEF456", "/dev/video1", "Camera 2", {}),
-            CameraDevice(2, "1234", "5678", None, "/dev/video2", "Camera 3", {})
-        ]
-        
-        with StableCam(registry_path=temp_registry, poll_interval=0.05) as manager:
-            # Set up comprehensive event tracking
-            manager.on(EventType.ON_CONNECT.value, event_logger('connect'))
-            manager.on(EventType.ON_DISCONNECT.value, event_logger('disconnect'))
-            manager.on(EventType.ON_STATUS_CHANGE.value, event_logger('status_change'))
-            
-            # Phase 1: Initial registration
-            with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
-                stable_ids = []
-                for camera in cameras:
-                    stable_id = manager.register(camera)
-                    stable_ids.append(stable_id)
-                
-                # Start monitoring
-                manager.run()
-                time.sleep(0.1)
-            
-            # Phase 2: Simulate complex connection changes
-            scenarios = [
-                # All devices connected
-                cameras,
-                # One device disconnected
-                cameras[1:],
-                # Two devices disconnected
-                [cameras[0]],
-                # All devices disconnected
-                [],
-                # Devices reconnect in different order
-                [cameras[2], cameras[0]],
-                # All devices back
-                cameras
-            ]
-            
-            for scenario in scenarios:
-                with patch.object(manager.detector, 'detect_cameras', return_value=scenario):
-                    time.sleep(0.1)  # Let monitoring detect changes
-            
-            # Verify final state
-            final_devices = manager.list()
-            assert len(final_devices) == 3
-            
-            # Verify comprehensive event tracking
-            assert len(system_events) >= 6  # At least registration events
-            
-            # Verify all devices had events
-            event_stable_ids = {event['stable_id'] for event in system_events}
-            assert all(sid in event_stable_ids for sid in stable_ids)
-            
-            # Verify event types were recorded
-            event_types = {event['type'] for event in system_events}
-            assert 'connect' in event_types or 'status_change' in event_types
+        manager, mock_detect, stable_ids = workflow_manager
+        
+        # Each case starts from the pattern before it; the first starts from
+        # registration, which leaves every device connected
+        previous = set(WORKFLOW_SCENARIOS[scenario_idx - 1]) if scenario_idx else set(range(len(stable_ids)))
+        current = set(WORKFLOW_SCENARIOS[scenario_idx])
+        for i, stable_id in enumerate(stable_ids):
+            status = DeviceStatus.CONNECTED if i in previous else DeviceStatus.DISCONNECTED
+            manager.registry.update_status(stable_id, status)
+        
+        # Set up comprehensive event tracking
+        manager.on(EventType.ON_CONNECT.value, event_tracker.track_event('connect'))
+        manager.on(EventType.ON_DISCONNECT.value, event_tracker.track_event('disconnect'))
+        manager.on(EventType.ON_STATUS_CHANGE.value, event_tracker.track_event('status_change'))
+        
+        try:
+            # Run one monitoring iteration to detect changes
+            mock_detect.return_value = [sample_cameras[i] for i in WORKFLOW_SCENARIOS[scenario_idx]]
+            manager._monitor_tick()
+        finally:
+            manager.events.clear_subscribers()
+        
+        # Every device flipping state emits exactly one status change
+        assert event_tracker.get_count('status_change') == len(previous ^ current)
+        
+        connected_ids = {event['stable_id'] for event in event_tracker.get_events('connect')}
+        assert connected_ids == {stable_ids[i] for i in current - previous}
+        
+        disconnected_ids = {event['stable_id'] for event in event_tracker.get_events('disconnect')}
+        assert disconnected_ids == {stable_ids[i] for i in previous - current}
+        
+        # Verify final state
+        final_devices = {device.stable_id: device.status for device in manager.list()}
+        assert len(final_devices) == 3
+        for i, stable_id in enumerate(stable_ids):
+            expected = DeviceStatus.CONNECTED if i in current else DeviceStatus.DISCONNECTED
+            assert final_devices[stable_id] == expected
+    
+    @pytest.fixture
+    def stress_scenarios(self, multiple_camera_devices):
+        """Map the pre-generated stress scenarios onto camera devices."""
+        assert len(multiple_camera_devices) == _STRESS_CAMERA_COUNT
+        return [[multiple_camera_devices[i] for i in scenario] for scenario in STRESS_SCENARIOS]
     
     @pytest.mark.integration
-    def test_stress_test_rapid_changes(self, temp_registry):
+    @pytest.mark.xdist_group("monitor")
+    def test_stress_test_rapid_changes(self, temp_registry, event_tracker, multiple_camera_devices,
+                                       stress_scenarios):
         """Stress test with rapid device connection changes."""
-        cameras = [
-            CameraDevice(i, f"{i:04x}", f"{i+1000:04x}", f"SER{i:03d}", 
-                        f"/dev/video{i}", f"Camera {i}", {})
-            for i in range(5)
-        ]
+        cameras = list(multiple_camera_devices)
         
-        change_count = 0
-        
-        with StableCam(registry_path=temp_registry, poll_interval=0.02) as manager:
+        # Keep detection patched for the whole run so every poll sees the
+        # scenario under test
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL) as manager, \
+                patch.object(manager.detector, 'detect_cameras', return_value=cameras) as mock_detect:
             # Register all devices initially
-            with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
-                for camera in cameras:
-                    manager.register(camera)
+            stable_ids = [manager.register(camera) for camera in cameras]
             
             # Track status changes
-            def count_changes(device):
-                nonlocal change_count
-                change_count += 1
-            
-            manager.on(EventType.ON_STATUS_CHANGE.value, count_changes)
+            manager.on(EventType.ON_STATUS_CHANGE.value, event_tracker.track_event('status_change'))
             manager.run()
             
-            # Rapidly change device configurations
-            import random
-            for _ in range(20):  # 20 rapid changes
-                # Randomly select subset of devices
-                active_cameras = random.sample(cameras, random.randint(0, len(cameras)))
+            def reached(active_cameras):
+                """Build a predicate for every device reporting its expected status."""
+                expected = {
+                    stable_id: DeviceStatus.CONNECTED if camera in active_cameras
+                    else DeviceStatus.DISCONNECTED
+                    for stable_id, camera in zip(stable_ids, cameras)
+                }
                 
-                with patch.object(manager.detector, 'detect_cameras', return_value=active_cameras):
-                    time.sleep(0.03)  # Brief pause between changes
+                def predicate():
+                    statuses = event_tracker.get_latest_statuses()
+                    return all(statuses.get(stable_id, DeviceStatus.CONNECTED) == status
+                               for stable_id, status in expected.items())
+                return predicate
+            
+            # Every device flipping state between scenarios emits one status change
+            expected_changes = 0
+            connected = [True] * len(cameras)
             
-            # Let final state settle
-            time.sleep(0.1)
+            # Rapidly change device configurations
+            for active_cameras in stress_scenarios:
+                now_connected = [camera in active_cameras for camera in cameras]
+                expected_changes += sum(a != b for a, b in zip(connected, now_connected))
+                connected = now_connected
+                
+                mock_detect.return_value = active_cameras
+                assert event_tracker.wait_for(reached(active_cameras))
             
             # Verify system handled rapid changes
             final_devices = manager.list()
             assert len(final_devices) == len(cameras)  # All devices still registered
-            assert change_count > 10  # Multiple status changes detected
+            assert event_tracker.get_count('status_change') == expected_changes
             
             # Verify system is still responsive
-            with patch.object(manager.detector, 'detect_cameras', return_value=cameras):
-                time.sleep(0.1)
-                
+            mock_detect.return_value = cameras
+            assert event_tracker.wait_for(reached(cameras))
+            
             # All devices should be connected in final state
             final_devices = manager.list()
             connected_count = sum(1 for d in final_devices if d.status == DeviceStatus.CONNECTED)
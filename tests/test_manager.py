@@ -6,10 +6,7 @@ registration, event handling, and monitoring loop integration.
 """
 
 import pytest
-import tempfile
 import threading
-import time
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from stablecam.manager import StableCam
@@ -18,22 +15,14 @@ from stablecam.registry import RegistryError
 from stablecam.backends import PlatformDetectionError
 from stablecam.events import EventType
 
+# Monitoring interval for every StableCam built here; StableCam clamps
+# poll_interval to a 0.1s floor, so this is the fastest the loop can run
+TEST_POLL_INTERVAL = 0.1
+
 
 class TestStableCamManager:
     """Test suite for StableCam manager class."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        # Remove the empty file so DeviceRegistry can create it properly
-        registry_path.unlink()
-        yield registry_path
-        # Cleanup
-        if registry_path.exists():
-            registry_path.unlink()
-    
     @pytest.fixture
     def sample_camera(self):
         """Create a sample camera device for testing."""
@@ -63,7 +52,7 @@ class TestStableCamManager:
     @pytest.fixture
     def stablecam(self, temp_registry):
         """Create StableCam instance with temporary registry."""
-        return StableCam(registry_path=temp_registry, poll_interval=0.1)
+        return StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL)
     
     def test_init(self, temp_registry):
         """Test StableCam initialization."""
@@ -94,7 +83,7 @@ class TestStableCamManager:
         mock_detector_class.return_value = mock_detector
         
         # Create new instance to use mocked detector
-        manager = StableCam(poll_interval=0.1)
+        manager = StableCam(poll_interval=TEST_POLL_INTERVAL)
         manager.detector = mock_detector
         
         # Test detection
@@ -113,43 +102,52 @@ class TestStableCamManager:
         mock_detector_class.return_value = mock_detector
         
         # Create new instance to use mocked detector
-        manager = StableCam(poll_interval=0.1)
+        manager = StableCam(poll_interval=TEST_POLL_INTERVAL)
         manager.detector = mock_detector
         
         # Test detection failure
         with pytest.raises(PlatformDetectionError):
             manager.detect()
     
-    def test_register_new_device(self, stablecam, sample_camera):
-        """Test registering a new device."""
-        # Mock detector to return empty list (no devices detected)
-        with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stable_id = stablecam.register(sample_camera)
+    @pytest.mark.parametrize("scenario,expected_ids", [
+        ("single", ["stable-cam-001"]),
+        ("duplicate", ["stable-cam-001", "stable-cam-001"]),
+        ("two_devices", ["stable-cam-001", "stable-cam-002"]),
+        ("missing_id", []),
+    ])
+    def test_register_and_lookup(self, stablecam, sample_camera, sample_camera_no_serial,
+                                 scenario, expected_ids):
+        """Test registering devices and looking them up by ID and in the device list."""
+        cameras = {
+            "single": [sample_camera],
+            "duplicate": [sample_camera, sample_camera],
+            "two_devices": [sample_camera, sample_camera_no_serial],
+            "missing_id": [],
+        }[scenario]
         
-        assert stable_id == "stable-cam-001"
-        
-        # Verify device is in registry
-        registered_device = stablecam.get_by_id(stable_id)
-        assert registered_device is not None
-        assert registered_device.stable_id == stable_id
-        assert registered_device.status == DeviceStatus.CONNECTED
-    
-    def test_register_existing_device(self, stablecam, sample_camera):
-        """Test registering an already registered device."""
-        # Register device first time
-        with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stable_id1 = stablecam.register(sample_camera)
+        # Initially empty
+        assert stablecam.list() == []
         
-        # Register same device again
+        # Mock detector to return empty list (no devices detected)
         with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stable_id2 = stablecam.register(sample_camera)
+            stable_ids = [stablecam.register(camera) for camera in cameras]
         
-        # Should return same stable ID
-        assert stable_id1 == stable_id2
+        # Re-registering a device returns its existing stable ID
+        assert stable_ids == expected_ids
         
-        # Should only have one device in registry
+        # Every distinct device is listed exactly once
         devices = stablecam.list()
-        assert len(devices) == 1
+        assert sorted(device.stable_id for device in devices) == sorted(set(expected_ids))
+        
+        # Verify each device is in registry
+        for stable_id, camera in zip(stable_ids, cameras):
+            registered_device = stablecam.get_by_id(stable_id)
+            assert registered_device is not None
+            assert registered_device.stable_id == stable_id
+            assert registered_device.status == DeviceStatus.CONNECTED
+            assert registered_device.device_info.vendor_id == camera.vendor_id
+        
+        assert stablecam.get_by_id("nonexistent-id") is None
     
     def test_register_with_events(self, stablecam, sample_camera):
         """Test that registration emits appropriate events."""
@@ -171,42 +169,20 @@ class TestStableCamManager:
         registered_device = connect_callback.call_args[0][0]
         assert registered_device.stable_id == stable_id
     
-    def test_list_devices(self, stablecam, sample_camera, sample_camera_no_serial):
-        """Test listing all registered devices."""
-        # Initially empty
-        devices = stablecam.list()
-        assert len(devices) == 0
-        
-        # Register devices
-        with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stablecam.register(sample_camera)
-            stablecam.register(sample_camera_no_serial)
-        
-        # List devices
-        devices = stablecam.list()
-        assert len(devices) == 2
+    def test_register_many_matches_register(self, stablecam, sample_camera, sample_camera_no_serial):
+        """Test batch registration returns existing IDs and emits events only for new devices."""
+        existing_id = stablecam.register(sample_camera)
         
-        stable_ids = [device.stable_id for device in devices]
-        assert "stable-cam-001" in stable_ids
-        assert "stable-cam-002" in stable_ids
-    
-    def test_get_by_id_existing(self, stablecam, sample_camera):
-        """Test getting device by existing stable ID."""
-        # Register device
-        with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stable_id = stablecam.register(sample_camera)
+        connect_callback = Mock()
+        stablecam.on(EventType.ON_CONNECT.value, connect_callback)
         
-        # Get by ID
-        device = stablecam.get_by_id(stable_id)
+        stable_ids = stablecam.register_many([sample_camera, sample_camera_no_serial, sample_camera_no_serial])
         
-        assert device is not None
-        assert device.stable_id == stable_id
-        assert device.device_info.vendor_id == sample_camera.vendor_id
-    
-    def test_get_by_id_nonexistent(self, stablecam):
-        """Test getting device by non-existent stable ID."""
-        device = stablecam.get_by_id("nonexistent-id")
-        assert device is None
+        new_id = stable_ids[1]
+        assert stable_ids == [existing_id, new_id, new_id]
+        assert new_id != existing_id
+        connect_callback.assert_called_once()
+        assert connect_callback.call_args[0][0].stable_id == new_id
     
     def test_event_subscription(self, stablecam):
         """Test event subscription functionality."""
@@ -231,6 +207,7 @@ class TestStableCamManager:
         with pytest.raises(TypeError):
             stablecam.on(EventType.ON_CONNECT.value, "not_callable")
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_start_stop(self, stablecam):
         """Test starting and stopping device monitoring."""
         assert not stablecam._monitoring
@@ -244,25 +221,36 @@ class TestStableCamManager:
         stablecam.stop()
         assert not stablecam._monitoring
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_double_start(self, stablecam):
         """Test starting monitoring when already running."""
-        stablecam.run()
-        assert stablecam._monitoring
-        
-        # Try to start again - should not crash
-        stablecam.run()
-        assert stablecam._monitoring
-        
-        stablecam.stop()
+        # Only the monitoring flag matters here, so no real thread is started
+        with patch('stablecam.manager.threading.Thread') as mock_thread_class:
+            mock_thread_class.return_value.is_alive.return_value = False
+            
+            stablecam.run()
+            assert stablecam._monitoring
+            assert stablecam._monitor_thread is not None
+            
+            # Try to start again - should not crash
+            stablecam.run()
+            assert stablecam._monitoring
+            mock_thread_class.assert_called_once()
+            
+            stablecam.stop()
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_double_stop(self, stablecam):
         """Test stopping monitoring when not running."""
         assert not stablecam._monitoring
         
-        # Try to stop when not running - should not crash
-        stablecam.stop()
-        assert not stablecam._monitoring
+        with patch('stablecam.manager.threading.Thread') as mock_thread_class:
+            # Try to stop when not running - should not crash
+            stablecam.stop()
+            assert not stablecam._monitoring
+            mock_thread_class.assert_not_called()
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_device_connection(self, stablecam, sample_camera):
         """Test monitoring detects device connections."""
         connect_callback = Mock()
@@ -282,19 +270,15 @@ class TestStableCamManager:
         connect_callback.reset_mock()
         status_callback.reset_mock()
         
-        # Start monitoring with device detected
+        # Run one monitoring iteration with device detected
         with patch.object(stablecam.detector, 'detect_cameras', return_value=[sample_camera]):
-            stablecam.run()
-            
-            # Wait for monitoring loop to run
-            time.sleep(0.2)
-            
-            stablecam.stop()
+            assert stablecam._monitor_tick() == stablecam.poll_interval
         
         # Verify connection events were emitted
         assert connect_callback.called
         assert status_callback.called
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_device_disconnection(self, stablecam, sample_camera):
         """Test monitoring detects device disconnections."""
         disconnect_callback = Mock()
@@ -311,33 +295,70 @@ class TestStableCamManager:
         disconnect_callback.reset_mock()
         status_callback.reset_mock()
         
-        # Start monitoring with no devices detected
+        # Run one monitoring iteration with no devices detected
         with patch.object(stablecam.detector, 'detect_cameras', return_value=[]):
-            stablecam.run()
-            
-            # Wait for monitoring loop to run
-            time.sleep(0.2)
-            
-            stablecam.stop()
+            assert stablecam._monitor_tick() == stablecam.poll_interval
         
         # Verify disconnection events were emitted
         assert disconnect_callback.called
         assert status_callback.called
     
+    @pytest.mark.xdist_group("monitor")
     def test_monitoring_error_handling(self, stablecam):
         """Test monitoring handles detection errors gracefully."""
+        hit = threading.Event()
+        
+        def raise_and_signal():
+            hit.set()
+            raise Exception("Detection error")
+        
         # Mock detector to raise exception
-        with patch.object(stablecam.detector, 'detect_cameras', side_effect=Exception("Detection error")):
+        with patch.object(stablecam.detector, 'detect_cameras', side_effect=raise_and_signal):
             stablecam.run()
             
-            # Wait for monitoring loop to run and handle error
-            time.sleep(0.2)
+            # Wait for monitoring loop to hit the error
+            assert hit.wait(timeout=1.0)
             
             # Should still be monitoring despite error
             assert stablecam._monitoring
             
             stablecam.stop()
     
+    def test_monitor_tick_backs_off_and_stops_on_errors(self, stablecam):
+        """Test that a monitoring iteration backs off on errors and stops after too many."""
+        error = PlatformDetectionError("Detection error")
+        with patch.object(stablecam.detector, 'detect_cameras', side_effect=error):
+            stablecam._monitoring = True
+            
+            # Platform errors back off exponentially from the poll interval
+            assert stablecam._monitor_tick() == stablecam.poll_interval * 2
+            assert stablecam._monitor_tick() == stablecam.poll_interval * 4
+            
+            for _ in range(stablecam._max_consecutive_errors - 3):
+                assert stablecam._monitor_tick() is not None
+            
+            # The last allowed error stops monitoring
+            assert stablecam._monitor_tick() is None
+            assert not stablecam._monitoring
+    
+    @pytest.mark.xdist_group("monitor")
+    def test_monitoring_uses_injected_clock(self, temp_registry):
+        """Test that the monitoring loop waits through the injected clock."""
+        waits = []
+        
+        def clock(timeout):
+            waits.append(timeout)
+            return len(waits) >= 3  # Stop after the third poll
+        
+        stablecam = StableCam(registry_path=temp_registry, poll_interval=0.5, clock=clock)
+        with patch.object(stablecam.detector, 'detect_cameras', return_value=[]) as mock_detect:
+            stablecam.run()
+            stablecam._monitor_thread.join(timeout=1.0)
+            stablecam.stop()
+        
+        assert waits == [0.5, 0.5, 0.5]
+        assert mock_detect.call_count == 3
+    
     def test_context_manager(self, temp_registry):
         """Test StableCam as context manager."""
         with StableCam(registry_path=temp_registry) as manager:
@@ -369,9 +390,7 @@ class TestStableCamManager:
         stablecam.registry.update_status(stable_id, DeviceStatus.DISCONNECTED)
         
         with patch.object(stablecam.detector, 'detect_cameras', return_value=[reconnected_camera]):
-            stablecam.run()
-            time.sleep(0.2)
-            stablecam.stop()
+            stablecam._monitor_tick()
         
         # Verify system index was updated
         registered_device = stablecam.get_by_id(stable_id)
@@ -382,79 +401,43 @@ class TestStableCamManager:
 class TestStableCamIntegration:
     """Integration tests for StableCam with real components."""
     
-    @pytest.fixture
-    def temp_registry(self):
-        """Create a temporary registry file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            registry_path = Path(f.name)
-        # Remove the empty file so DeviceRegistry can create it properly
-        registry_path.unlink()
-        yield registry_path
-        # Cleanup
-        if registry_path.exists():
-            registry_path.unlink()
-    
-    def test_full_workflow_integration(self, temp_registry):
+    def test_full_workflow_integration(self, temp_registry, event_tracker, sample_cameras):
         """Test complete workflow from detection to monitoring."""
-        # Create sample devices
-        camera1 = CameraDevice(
-            system_index=0,
-            vendor_id="046d",
-            product_id="085b",
-            serial_number="ABC123",
-            port_path="/dev/video0",
-            label="Camera 1",
-            platform_data={}
-        )
-        
-        camera2 = CameraDevice(
-            system_index=1,
-            vendor_id="1234",
-            product_id="5678",
-            serial_number=None,
-            port_path="/dev/video1",
-            label="Camera 2",
-            platform_data={}
-        )
-        
-        # Event tracking
-        events_received = []
+        # Sample devices with and without a serial number
+        camera1, camera2 = sample_cameras[0], sample_cameras[2]
         
-        def track_events(device):
-            events_received.append(device.stable_id)
-        
-        with StableCam(registry_path=temp_registry, poll_interval=0.1) as manager:
+        # Mock detection to return both cameras
+        with StableCam(registry_path=temp_registry, poll_interval=TEST_POLL_INTERVAL) as manager, \
+                patch.object(manager.detector, 'detect_cameras',
+                             return_value=[camera1, camera2]) as mock_detect:
             # Subscribe to events
-            manager.on(EventType.ON_CONNECT.value, track_events)
-            manager.on(EventType.ON_DISCONNECT.value, track_events)
+            manager.on(EventType.ON_CONNECT.value, event_tracker.track_event('connect'))
+            manager.on(EventType.ON_DISCONNECT.value, event_tracker.track_event('disconnect'))
+            
+            # Register devices
+            id1 = manager.register(camera1)
+            id2 = manager.register(camera2)
+            
+            assert id1 == "stable-cam-001"
+            assert id2 == "stable-cam-002"
             
-            # Mock detection to return both cameras
-            with patch.object(manager.detector, 'detect_cameras', return_value=[camera1, camera2]):
-                # Register devices
-                id1 = manager.register(camera1)
-                id2 = manager.register(camera2)
-                
-                assert id1 == "stable-cam-001"
-                assert id2 == "stable-cam-002"
-                
-                # Verify both devices are listed
-                devices = manager.list()
-                assert len(devices) == 2
-                
-                # Start monitoring
-                manager.run()
-                time.sleep(0.2)
+            # Verify both devices are listed
+            devices = manager.list()
+            assert len(devices) == 2
+            
+            # Start monitoring
+            manager.run()
             
             # Simulate camera1 disconnection
-            with patch.object(manager.detector, 'detect_cameras', return_value=[camera2]):
-                time.sleep(0.2)
+            mock_detect.return_value = [camera2]
+            assert event_tracker.wait_for_count('disconnect', 1)
             
             # Simulate both cameras disconnection
-            with patch.object(manager.detector, 'detect_cameras', return_value=[]):
-                time.sleep(0.2)
+            mock_detect.return_value = []
+            assert event_tracker.wait_for_count('disconnect', 2)
         
         # Verify events were received
-        assert len(events_received) >= 2  # At least connect events for registration
+        assert len(event_tracker.get_events()) >= 2  # At least connect events for registration
         
         # Verify final state
         final_devices = manager.list()
@@ -6,6 +6,7 @@ identifier generation logic according to requirements 1.1, 1.2, 7.1, 7.2, 7.3.
 """
 
 import unittest
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 from unittest.mock import patch
 import time
@@ -14,7 +15,8 @@ from stablecam.models import (
     CameraDevice, 
     RegisteredDevice, 
     DeviceStatus,
-    generate_stable_id
+    generate_stable_id,
+    parse_stable_id
 )
 
 
@@ -31,9 +33,10 @@ class TestDeviceStatus(unittest.TestCase):
 class TestCameraDevice(unittest.TestCase):
     """Test CameraDevice data class and hardware ID generation."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.device_with_serial = CameraDevice(
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.device_with_serial = CameraDevice(
             system_index=0,
             vendor_id="046d",
             product_id="085b",
@@ -43,7 +46,7 @@ class TestCameraDevice(unittest.TestCase):
             platform_data={"driver": "uvcvideo"}
         )
         
-        self.device_without_serial = CameraDevice(
+        cls.device_without_serial = CameraDevice(
             system_index=1,
             vendor_id="046d",
             product_id="085b",
@@ -53,7 +56,7 @@ class TestCameraDevice(unittest.TestCase):
             platform_data={"driver": "uvcvideo"}
         )
         
-        self.device_no_serial_no_port = CameraDevice(
+        cls.device_no_serial_no_port = CameraDevice(
             system_index=2,
             vendor_id="046d",
             product_id="085b",
@@ -74,16 +77,32 @@ class TestCameraDevice(unittest.TestCase):
         expected = "vid-pid-port:046d:085b:/dev/usb1/1-2"
         self.assertEqual(hardware_id, expected)
 
-    def test_generate_hardware_id_fallback(self):
+    @patch('time.time', return_value=1234567890.123)
+    def test_generate_hardware_id_fallback(self, mock_time):
         """Test hardware ID generation fallback method (Requirement 7.3)."""
-        with patch('time.time', return_value=1234567890.123):
-            hardware_id = self.device_no_serial_no_port.generate_hardware_id()
-            # Should start with vid-pid-hash prefix
-            self.assertTrue(hardware_id.startswith("vid-pid-hash:046d:085b:"))
-            # Should contain a hash component
-            parts = hardware_id.split(":")
-            self.assertEqual(len(parts), 4)
-            self.assertEqual(len(parts[3]), 8)  # MD5 hash truncated to 8 chars
+        # Fresh copy so the timestamp is captured under the patched clock
+        device = replace(self.device_no_serial_no_port)
+        hardware_id = device.generate_hardware_id()
+        # Should be the vid-pid-hash prefix followed by a hash component
+        kind, vendor_id, product_id, digest = hardware_id.split(":")
+        self.assertEqual((kind, vendor_id, product_id), ("vid-pid-hash", "046d", "085b"))
+        self.assertEqual(len(digest), 8)  # 4-byte BLAKE2b digest as 8 hex chars
+        
+        # The timestamp is frozen into the cached ID on first access
+        mock_time.return_value += 60
+        self.assertEqual(device.generate_hardware_id(), hardware_id)
+        self.assertTrue(device.matches_hardware_id(hardware_id))
+
+    def test_camera_device_is_immutable(self):
+        """Test that CameraDevice fields cannot be reassigned."""
+        with self.assertRaises(FrozenInstanceError):
+            self.device_with_serial.serial_number = "CHANGED"
+
+    def test_camera_device_is_hashable(self):
+        """Test that CameraDevice can be used as a dict key or set member."""
+        same_device = replace(self.device_with_serial)
+        self.assertEqual(hash(same_device), hash(self.device_with_serial))
+        self.assertEqual({self.device_with_serial: "cam"}[same_device], "cam")
 
     def test_matches_hardware_id(self):
         """Test hardware ID matching functionality."""
@@ -130,12 +149,21 @@ class TestCameraDevice(unittest.TestCase):
         self.assertNotEqual(id1, id2)
 
 
+# Existing stable ID sets shared by the stable ID generation tests
+_SEQUENTIAL_IDS = frozenset({"stable-cam-001", "stable-cam-002"})
+_GAPPED_IDS = frozenset({"stable-cam-001", "stable-cam-003", "stable-cam-005"})
+
+# Wall-clock reading frozen for the status update tests
+FROZEN_NOW = datetime(2024, 1, 15, 15, 0, 0)
+
+
 class TestRegisteredDevice(unittest.TestCase):
     """Test RegisteredDevice data class and methods."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.camera_device = CameraDevice(
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.camera_device = CameraDevice(
             system_index=0,
             vendor_id="046d",
             product_id="085b",
@@ -144,7 +172,9 @@ class TestRegisteredDevice(unittest.TestCase):
             label="Logitech C920 HD Pro Webcam",
             platform_data={"driver": "uvcvideo"}
         )
-        
+    
+    def setUp(self):
+        """Create a fresh registered device, since tests mutate it."""
         self.registered_device = RegisteredDevice(
             stable_id="stable-cam-001",
             device_info=self.camera_device,
@@ -157,16 +187,13 @@ class TestRegisteredDevice(unittest.TestCase):
         """Test updating device status to connected updates last_seen."""
         old_last_seen = self.registered_device.last_seen
         
-        # Mock datetime.now() to control the timestamp
         with patch('stablecam.models.datetime') as mock_datetime:
-            mock_now = datetime(2024, 1, 15, 15, 0, 0)
-            mock_datetime.now.return_value = mock_now
-            
+            mock_datetime.now.return_value = FROZEN_NOW
             self.registered_device.update_status(DeviceStatus.CONNECTED)
-            
-            self.assertEqual(self.registered_device.status, DeviceStatus.CONNECTED)
-            self.assertEqual(self.registered_device.last_seen, mock_now)
-            self.assertNotEqual(self.registered_device.last_seen, old_last_seen)
+        
+        self.assertEqual(self.registered_device.status, DeviceStatus.CONNECTED)
+        self.assertEqual(self.registered_device.last_seen, FROZEN_NOW)
+        self.assertNotEqual(self.registered_device.last_seen, old_last_seen)
 
     def test_update_status_disconnected(self):
         """Test updating device status to disconnected doesn't update last_seen."""
@@ -196,41 +223,39 @@ class TestRegisteredDevice(unittest.TestCase):
 
 class TestStableIdGeneration(unittest.TestCase):
     """Test stable ID generation functionality."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.device = CameraDevice(
-            system_index=0,
-            vendor_id="046d",
-            product_id="085b",
-            serial_number="ABC123456",
-            port_path="/dev/usb1/1-1",
-            label="Logitech C920 HD Pro Webcam",
-            platform_data={"driver": "uvcvideo"}
-        )
 
     def test_generate_stable_id_first_device(self):
         """Test generating stable ID for first device (Requirement 1.2)."""
-        existing_ids = set()
-        stable_id = generate_stable_id(self.device, existing_ids)
+        stable_id, next_number = generate_stable_id(set())
         self.assertEqual(stable_id, "stable-cam-001")
+        self.assertEqual(next_number, 2)
 
     def test_generate_stable_id_sequential(self):
-        """Test generating sequential stable IDs."""
-        existing_ids = {"stable-cam-001", "stable-cam-002"}
-        stable_id = generate_stable_id(self.device, existing_ids)
+        """Test generating sequential stable IDs from the counter."""
+        stable_id, next_number = generate_stable_id(_SEQUENTIAL_IDS, 3)
         self.assertEqual(stable_id, "stable-cam-003")
+        self.assertEqual(next_number, 4)
+
+    def test_generate_stable_id_does_not_reuse_gaps(self):
+        """Test that numbers below the counter are not reused."""
+        stable_id, _ = generate_stable_id(_GAPPED_IDS, 6)
+        self.assertEqual(stable_id, "stable-cam-006")
 
-    def test_generate_stable_id_gaps(self):
-        """Test generating stable ID fills gaps in sequence."""
-        existing_ids = {"stable-cam-001", "stable-cam-003", "stable-cam-005"}
-        stable_id = generate_stable_id(self.device, existing_ids)
-        self.assertEqual(stable_id, "stable-cam-002")
+    def test_generate_stable_id_steps_over_existing_ids(self):
+        """Test that IDs already present at the counter are skipped."""
+        stable_id, next_number = generate_stable_id(_GAPPED_IDS, 3)
+        self.assertEqual(stable_id, "stable-cam-004")
+        self.assertEqual(next_number, 5)
+
+    def test_generate_stable_id_ignores_foreign_ids(self):
+        """Test that IDs outside the stable-cam sequence don't affect numbering."""
+        existing_ids = {"custom-camera", "stable-cam-abc", "other-cam-001"}
+        stable_id, _ = generate_stable_id(existing_ids)
+        self.assertEqual(stable_id, "stable-cam-001")
 
     def test_generate_stable_id_format(self):
         """Test stable ID format is correct."""
-        existing_ids = set()
-        stable_id = generate_stable_id(self.device, existing_ids)
+        stable_id, _ = generate_stable_id(set())
         
         # Should match pattern stable-cam-XXX where XXX is zero-padded number
         self.assertTrue(stable_id.startswith("stable-cam-"))
@@ -241,20 +266,22 @@ class TestStableIdGeneration(unittest.TestCase):
     def test_generate_stable_id_uniqueness(self):
         """Test that generated stable IDs are unique."""
         existing_ids = set()
+        next_number = 1
         
         # Generate multiple IDs
-        id1 = generate_stable_id(self.device, existing_ids)
-        existing_ids.add(id1)
-        
-        id2 = generate_stable_id(self.device, existing_ids)
-        existing_ids.add(id2)
-        
-        id3 = generate_stable_id(self.device, existing_ids)
+        for _ in range(1000):
+            stable_id, next_number = generate_stable_id(existing_ids, next_number)
+            existing_ids.add(stable_id)
         
         # All should be different
-        self.assertNotEqual(id1, id2)
-        self.assertNotEqual(id2, id3)
-        self.assertNotEqual(id1, id3)
+        self.assertEqual(len(existing_ids), 1000)
+
+    def test_parse_stable_id(self):
+        """Test parsing sequence numbers back out of stable IDs."""
+        self.assertEqual(parse_stable_id("stable-cam-042"), 42)
+        self.assertEqual(parse_stable_id("stable-cam-1000"), 1000)
+        self.assertIsNone(parse_stable_id("stable-cam-abc"))
+        self.assertIsNone(parse_stable_id("custom-camera"))
 
 
 if __name__ == '__main__':
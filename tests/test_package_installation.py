@@ -2,16 +2,28 @@
 Tests for package installation and configuration across different platforms.
 """
 
-import sys
-import platform
+import os
+import shutil
 import subprocess
-import tempfile
-import venv
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from stablecam.platform_utils import is_linux, is_windows, is_macos
+
+# Evaluated once at import; every platform guard below reads these
+IS_LINUX = is_linux()
+IS_WINDOWS = is_windows()
+IS_MACOS = is_macos()
+
+
+@lru_cache(maxsize=None)
+def _tool_present(name):
+    """Check whether a system tool is on PATH, without running it."""
+    return shutil.which(name) is not None
+
 
 class TestPackageInstallation:
     """Test package installation and configuration."""
@@ -29,20 +41,14 @@ class TestPackageInstallation:
     
     def test_platform_detection(self):
         """Test that platform detection works correctly."""
-        from stablecam.platform_utils import (
-            get_platform_info, 
-            is_linux, 
-            is_windows, 
-            is_macos,
-            get_recommended_dependencies
-        )
+        from stablecam.platform_utils import get_platform_info, get_recommended_dependencies
         
         platform_info = get_platform_info()
         assert 'system' in platform_info
         assert 'python_version' in platform_info
         
         # Exactly one platform should be detected
-        platforms = [is_linux(), is_windows(), is_macos()]
+        platforms = [IS_LINUX, IS_WINDOWS, IS_MACOS]
         assert sum(platforms) == 1
         
         # Should return some dependencies for current platform
@@ -50,12 +56,10 @@ class TestPackageInstallation:
         assert isinstance(deps, list)
     
     @pytest.mark.linux
+    @pytest.mark.skipif(not IS_LINUX, reason="Linux-specific test")
     def test_linux_dependencies(self):
         """Test Linux-specific dependencies."""
-        from stablecam.platform_utils import is_linux, check_platform_dependencies
-        
-        if not is_linux():
-            pytest.skip("Linux-specific test")
+        from stablecam.platform_utils import check_platform_dependencies
         
         deps_status = check_platform_dependencies()
         
@@ -65,12 +69,10 @@ class TestPackageInstallation:
             assert check in deps_status
     
     @pytest.mark.windows
+    @pytest.mark.skipif(not IS_WINDOWS, reason="Windows-specific test")
     def test_windows_dependencies(self):
         """Test Windows-specific dependencies."""
-        from stablecam.platform_utils import is_windows, check_platform_dependencies
-        
-        if not is_windows():
-            pytest.skip("Windows-specific test")
+        from stablecam.platform_utils import check_platform_dependencies
         
         deps_status = check_platform_dependencies()
         
@@ -80,12 +82,10 @@ class TestPackageInstallation:
             assert check in deps_status
     
     @pytest.mark.macos
+    @pytest.mark.skipif(not IS_MACOS, reason="macOS-specific test")
     def test_macos_dependencies(self):
         """Test macOS-specific dependencies."""
-        from stablecam.platform_utils import is_macos, check_platform_dependencies
-        
-        if not is_macos():
-            pytest.skip("macOS-specific test")
+        from stablecam.platform_utils import check_platform_dependencies
         
         deps_status = check_platform_dependencies()
         
@@ -106,19 +106,22 @@ class TestPackageInstallation:
             "events.py", "platform_utils.py", "logging_config.py", "tui.py"
         ]
         
+        # Read each directory once and check names against the listing
+        package_entries = {entry.name for entry in os.scandir(package_dir)}
+        
         for module in expected_modules:
-            assert (package_dir / module).exists(), f"Module {module} missing"
+            assert module in package_entries, f"Module {module} missing"
         
         # Check backends directory
-        backends_dir = package_dir / "backends"
-        assert backends_dir.exists(), "Backends directory missing"
+        assert "backends" in package_entries, "Backends directory missing"
+        backend_entries = {entry.name for entry in os.scandir(package_dir / "backends")}
         
         expected_backends = ["__init__.py", "base.py", "linux.py", "windows.py", "macos.py", "exceptions.py"]
         for backend in expected_backends:
-            assert (backends_dir / backend).exists(), f"Backend {backend} missing"
+            assert backend in backend_entries, f"Backend {backend} missing"
         
         # Check type hints marker
-        assert (package_dir / "py.typed").exists(), "Type hints marker missing"
+        assert "py.typed" in package_entries, "Type hints marker missing"
     
     def test_setup_configuration(self):
         """Test that setup.py configuration is correct."""
@@ -131,33 +134,32 @@ class TestPackageInstallation:
         
         # Test platform dependencies function
         deps = get_platform_dependencies()
-        assert isinstance(deps, list)
+        assert isinstance(deps, tuple)
+        assert get_platform_dependencies() is deps
         
         # Test extras configuration
         extras = get_platform_extras()
-        expected_extras = ["tui", "dev", "test", "linux-enhanced", "windows-enhanced", "macos-enhanced", "all"]
+        expected_extras = ["tui", "dev", "test", "linux-enhanced", "windows-enhanced", "macos-enhanced", "fast", "all"]
         
         for extra in expected_extras:
             assert extra in extras, f"Extra '{extra}' missing from setup configuration"
-            assert isinstance(extras[extra], list), f"Extra '{extra}' should be a list"
+            assert isinstance(extras[extra], tuple), f"Extra '{extra}' should be a tuple"
+        
+        # Results are cached and can't be modified by callers
+        assert get_platform_extras() is extras
+        with pytest.raises(TypeError):
+            extras["tui"] = ("textual",)
     
-    def test_cli_help_command(self):
+    def test_cli_help_command(self, capsys):
         """Test that CLI help command works."""
-        try:
-            result = subprocess.run(
-                [sys.executable, "-c", "from stablecam.cli import main; main(['--help'])"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            # Should not crash and should contain help text
-            assert "StableCam" in result.stdout or "stablecam" in result.stdout.lower()
-            
-        except subprocess.TimeoutExpired:
-            pytest.fail("CLI help command timed out")
-        except Exception as e:
-            pytest.fail(f"CLI help command failed: {e}")
+        from stablecam.cli import main
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(['--help'])
+        
+        # Should exit cleanly and print help text
+        assert exc_info.value.code == 0
+        assert "stablecam" in capsys.readouterr().out.lower()
     
     def test_optional_imports(self):
         """Test that optional dependencies are handled gracefully."""
@@ -171,120 +173,67 @@ class TestPackageInstallation:
             assert "textual" in str(e).lower() or "tui" in str(e).lower()
     
     @pytest.mark.slow
-    def test_virtual_environment_installation(self):
-        """Test installation in a clean virtual environment."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_dir = Path(temp_dir) / "test_venv"
-            
-            # Create virtual environment
-            venv.create(venv_dir, with_pip=True)
-            
-            # Get paths for the virtual environment
-            if platform.system() == "Windows":
-                python_exe = venv_dir / "Scripts" / "python.exe"
-                pip_exe = venv_dir / "Scripts" / "pip.exe"
-            else:
-                python_exe = venv_dir / "bin" / "python"
-                pip_exe = venv_dir / "bin" / "pip"
-            
-            try:
-                # Install package in development mode
-                result = subprocess.run(
-                    [str(pip_exe), "install", "-e", "."],
-                    cwd=Path.cwd(),
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                
-                if result.returncode != 0:
-                    pytest.skip(f"Package installation failed: {result.stderr}")
-                
-                # Test that package can be imported
-                result = subprocess.run(
-                    [str(python_exe), "-c", "import stablecam; print(stablecam.__version__)"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                assert result.returncode == 0, f"Import failed: {result.stderr}"
-                assert "0.1.0" in result.stdout
-                
-                # Test CLI entry point
-                result = subprocess.run(
-                    [str(python_exe), "-m", "stablecam", "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                # Should not crash (return code might be 0 or 2 for help)
-                assert result.returncode in [0, 2], f"CLI failed: {result.stderr}"
-                
-            except subprocess.TimeoutExpired:
-                pytest.skip("Virtual environment test timed out")
-            except Exception as e:
-                pytest.skip(f"Virtual environment test failed: {e}")
+    def test_venv_import(self, installed_venv):
+        """Test that the package imports in a clean virtual environment."""
+        result = subprocess.run(
+            [str(installed_venv.python), "-c", "import stablecam"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        assert result.returncode == 0, f"Import failed: {result.stderr}"
+    
+    @pytest.mark.slow
+    def test_venv_cli_help(self, installed_venv):
+        """Test the CLI entry point in a clean virtual environment."""
+        result = subprocess.run(
+            [str(installed_venv.python), "-m", "stablecam", "--help"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        # Should not crash (return code might be 0 or 2 for help)
+        assert result.returncode in [0, 2], f"CLI failed: {result.stderr}"
+    
+    @pytest.mark.slow
+    def test_venv_version(self, installed_venv):
+        """Test the installed package reports its version."""
+        result = subprocess.run(
+            [str(installed_venv.python), "-c", "import stablecam; print(stablecam.__version__)"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        assert result.returncode == 0, f"Import failed: {result.stderr}"
+        assert "0.1.0" in result.stdout
 
 
 class TestPlatformSpecificInstallation:
     """Test platform-specific installation scenarios."""
     
+    @pytest.mark.skipif(not IS_LINUX, reason="Linux-specific test")
     def test_linux_pyudev_availability(self):
         """Test that pyudev is available on Linux."""
-        from stablecam.platform_utils import is_linux
-        
-        if not is_linux():
-            pytest.skip("Linux-specific test")
-        
         try:
             import pyudev
             assert pyudev is not None
         except ImportError:
             pytest.fail("pyudev should be available on Linux installations")
     
+    @pytest.mark.skipif(not IS_WINDOWS, reason="Windows-specific test")
     def test_windows_builtin_apis(self):
         """Test that Windows built-in APIs are accessible."""
-        from stablecam.platform_utils import is_windows
-        
-        if not is_windows():
-            pytest.skip("Windows-specific test")
-        
-        # Test that we can access Windows-specific modules
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["wmic", "/?"],
-                capture_output=True,
-                timeout=5,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            # wmic should be available on Windows
-            assert result.returncode == 0 or "wmic" in result.stderr.decode().lower()
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pytest.skip("wmic not available in test environment")
+        # wmic should be available on Windows
+        assert _tool_present("wmic"), "wmic not found on PATH"
     
+    @pytest.mark.skipif(not IS_MACOS, reason="macOS-specific test")
     def test_macos_system_tools(self):
         """Test that macOS system tools are accessible."""
-        from stablecam.platform_utils import is_macos
-        
-        if not is_macos():
-            pytest.skip("macOS-specific test")
-        
-        # Test that we can access macOS-specific tools
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["system_profiler", "-listDataTypes"],
-                capture_output=True,
-                timeout=10
-            )
-            # system_profiler should be available on macOS
-            assert result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pytest.skip("system_profiler not available in test environment")
-
+        # system_profiler should be available on macOS
+        assert _tool_present("system_profiler"), "system_profiler not found on PATH"
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -6,13 +6,13 @@ file locking, atomic operations, and error handling scenarios.
 """
 
 import json
+import multiprocessing
 import os
-import tempfile
 import threading
-import time
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 
 import pytest
 
@@ -20,24 +20,44 @@ from stablecam.models import CameraDevice, DeviceStatus
 from stablecam.registry import DeviceRegistry, RegistryError, RegistryCorruptionError
 
 
+def _register_in_process(registry_path, process_index, device_count):
+    """Register device_count cameras one at a time from a separate process."""
+    registry = DeviceRegistry(registry_path, backend=DeviceRegistry.BACKEND_FILE, multiprocess=True)
+    for device_index in range(device_count):
+        registry.register(CameraDevice(
+            system_index=device_index,
+            vendor_id="046d",
+            product_id="085b",
+            serial_number=f"PROC{process_index}_SERIAL_{device_index}",
+            port_path=None,
+            label=f"Process {process_index} Camera {device_index}",
+            platform_data={}
+        ))
+
+
 class TestDeviceRegistry:
     """Test suite for DeviceRegistry class."""
     
     @pytest.fixture
-    def temp_registry_path(self):
-        """Create a temporary registry file path for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        tmp_path.unlink()  # Remove the file, we just want the path
-        yield tmp_path
-        # Cleanup
-        if tmp_path.exists():
-            tmp_path.unlink()
+    def temp_registry_path(self, temp_dir):
+        """Create a unique registry file path in the shared test directory."""
+        registry_path = temp_dir / f"reg-{uuid.uuid4().hex}.json"
+        yield registry_path
+        # Remove the registry along with any backups made from it
+        for path in temp_dir.glob(f"{registry_path.stem}.*"):
+            path.unlink()
     
     @pytest.fixture
     def registry(self, temp_registry_path):
-        """Create a DeviceRegistry instance with temporary storage."""
-        return DeviceRegistry(temp_registry_path)
+        """Create an in-memory DeviceRegistry instance; nothing touches the disk."""
+        registry = DeviceRegistry(temp_registry_path, backend=DeviceRegistry.BACKEND_MEMORY)
+        yield registry
+        DeviceRegistry.clear_memory_stores()
+    
+    @pytest.fixture
+    def file_registry(self, temp_registry_path):
+        """Create a file-backed DeviceRegistry instance, locked with flock(), for tests of on-disk behavior."""
+        return DeviceRegistry(temp_registry_path, backend=DeviceRegistry.BACKEND_FILE, multiprocess=True)
     
     @pytest.fixture
     def sample_device(self):
@@ -87,7 +107,8 @@ class TestDeviceRegistry:
         with open(temp_registry_path, 'r') as f:
             data = json.load(f)
         
-        assert data["version"] == "1.0"
+        assert data["version"] == "1.1"
+        assert data["next_id"] == 1
         assert data["devices"] == {}
     
     def test_register_device_success(self, registry, sample_device):
@@ -122,6 +143,22 @@ class TestDeviceRegistry:
         assert id1 == "stable-cam-001"
         assert id2 == "stable-cam-002"
     
+    def test_register_many_assigns_ids_in_order(self, registry, sample_device, sample_device_no_serial):
+        """Test that batch registration assigns sequential IDs in input order."""
+        stable_ids = registry.register_many([sample_device, sample_device_no_serial])
+        
+        assert stable_ids == ["stable-cam-001", "stable-cam-002"]
+        assert registry.get_by_id("stable-cam-002").device_info.vendor_id == sample_device_no_serial.vendor_id
+    
+    def test_register_many_duplicate_writes_nothing(self, registry, sample_device, sample_device_no_serial):
+        """Test that a batch containing a registered device fails without partial writes."""
+        registry.register(sample_device)
+        
+        with pytest.raises(RegistryError, match="Device already registered"):
+            registry.register_many([sample_device_no_serial, sample_device])
+        
+        assert [d.stable_id for d in registry.get_all()] == ["stable-cam-001"]
+    
     def test_get_all_devices(self, registry, sample_device, sample_device_no_serial):
         """Test retrieving all registered devices."""
         registry.register(sample_device)
@@ -157,19 +194,24 @@ class TestDeviceRegistry:
         updated_device = registry.get_by_id(stable_id)
         assert updated_device.status == DeviceStatus.DISCONNECTED
     
-    def test_update_status_connected_updates_last_seen(self, registry, sample_device):
+    def test_update_status_connected_updates_last_seen(self, temp_registry_path, sample_device):
         """Test that updating to CONNECTED status updates last_seen timestamp."""
-        stable_id = registry.register(sample_device)
-        original_device = registry.get_by_id(stable_id)
-        original_last_seen = original_device.last_seen
-        
-        # Wait a bit to ensure timestamp difference
-        time.sleep(0.01)
-        
-        registry.update_status(stable_id, DeviceStatus.CONNECTED)
-        
-        updated_device = registry.get_by_id(stable_id)
-        assert updated_device.last_seen > original_last_seen
+        t0 = datetime(2024, 1, 15, 10, 30, 0)
+        clock = Mock(return_value=t0)
+        registry = DeviceRegistry(temp_registry_path, backend=DeviceRegistry.BACKEND_MEMORY, clock=clock)
+        try:
+            stable_id = registry.register(sample_device)
+            assert registry.get_by_id(stable_id).last_seen == t0
+            
+            # Advance the injected clock instead of sleeping
+            clock.return_value = t0 + timedelta(seconds=1)
+            registry.update_status(stable_id, DeviceStatus.CONNECTED)
+            
+            updated_device = registry.get_by_id(stable_id)
+            assert updated_device.last_seen == t0 + timedelta(seconds=1)
+            assert updated_device.registered_at == t0
+        finally:
+            DeviceRegistry.clear_memory_stores()
     
     def test_update_status_nonexistent_device_raises_error(self, registry):
         """Test that updating nonexistent device raises error."""
@@ -212,34 +254,34 @@ class TestDeviceRegistry:
     
     def test_persistence_across_instances(self, temp_registry_path, sample_device):
         """Test that registry data persists across different instances."""
-        # Create first registry instance and register device
-        registry1 = DeviceRegistry(temp_registry_path)
+        # Create first registry instance and register device with fsync'd writes
+        registry1 = DeviceRegistry(temp_registry_path, durability=DeviceRegistry.DURABILITY_STRICT)
         stable_id = registry1.register(sample_device)
         
         # Create second registry instance and verify device exists
-        registry2 = DeviceRegistry(temp_registry_path)
+        registry2 = DeviceRegistry(temp_registry_path, durability=DeviceRegistry.DURABILITY_STRICT)
         retrieved_device = registry2.get_by_id(stable_id)
         
         assert retrieved_device is not None
         assert retrieved_device.stable_id == stable_id
         assert retrieved_device.device_info.label == sample_device.label
     
-    def test_atomic_write_operations(self, registry, sample_device, sample_device_no_serial):
+    def test_atomic_write_operations(self, file_registry, sample_device, sample_device_no_serial):
         """Test that write operations are atomic and don't corrupt registry."""
         # Register initial device
-        registry.register(sample_device)
+        file_registry.register(sample_device)
         
         # Test that the old atomic write method still works for status updates
         # (since register now uses direct file writing with locking)
-        stable_id = registry.get_all()[0].stable_id
+        stable_id = file_registry.get_all()[0].stable_id
         
         # Simulate failure in atomic write for status updates
         with patch('tempfile.NamedTemporaryFile', side_effect=OSError("Simulated failure")):
             with pytest.raises(RegistryError):  # Our error handling converts OSError to RegistryError
-                registry._write_registry_atomic({"version": "1.0", "devices": {}})
+                file_registry._write_registry_atomic({"version": "1.0", "devices": {}})
         
         # Verify registry is still intact and readable
-        all_devices = registry.get_all()
+        all_devices = file_registry.get_all()
         assert len(all_devices) == 1
         assert all_devices[0].device_info.label == sample_device.label
     
@@ -257,7 +299,7 @@ class TestDeviceRegistry:
         assert devices == []  # Should return empty list after recovery
         
         # After corruption handling, backup file should be created
-        backup_files = list(temp_registry_path.parent.glob("*.backup_*.json"))
+        backup_files = list(temp_registry_path.parent.glob(f"{temp_registry_path.stem}.backup_*.json"))
         assert len(backup_files) > 0
         
         # New registry should be created and functional
@@ -276,32 +318,37 @@ class TestDeviceRegistry:
         devices = registry.get_all()
         assert devices == []  # Should return empty list after recovery
     
-    def test_concurrent_access_safety(self, registry, sample_device):
+    def test_concurrent_access_safety(self, file_registry, sample_device):
         """Test that concurrent access to registry is safe."""
+        thread_count = 5
+        batch_size = 2
         results = []
         errors = []
         
-        def register_device(device_index):
+        # Slightly different devices with unique serial numbers, one slice per thread
+        devices = [
+            CameraDevice(
+                system_index=device_index,
+                vendor_id="046d",
+                product_id="085b",
+                serial_number=f"UNIQUE_SERIAL_{device_index}",
+                port_path=f"/dev/usb1/1-{device_index}",
+                label=f"Camera {device_index}",
+                platform_data={}
+            )
+            for device_index in range(thread_count * batch_size)
+        ]
+        
+        def register_batch(batch):
             try:
-                # Create slightly different devices with unique serial numbers
-                device = CameraDevice(
-                    system_index=device_index,
-                    vendor_id="046d",
-                    product_id="085b",
-                    serial_number=f"UNIQUE_SERIAL_{device_index}_{threading.current_thread().ident}",
-                    port_path=f"/dev/usb1/1-{device_index}",
-                    label=f"Camera {device_index}",
-                    platform_data={}
-                )
-                stable_id = registry.register(device)
-                results.append(stable_id)
+                results.extend(file_registry.register_many(batch))
             except Exception as e:
                 errors.append(e)
         
-        # Start multiple threads to register devices concurrently
+        # Start multiple threads to register batches concurrently
         threads = []
-        for i in range(5):
-            thread = threading.Thread(target=register_device, args=(i,))
+        for i in range(0, len(devices), batch_size):
+            thread = threading.Thread(target=register_batch, args=(devices[i:i + batch_size],))
             threads.append(thread)
             thread.start()
         
@@ -312,19 +359,41 @@ class TestDeviceRegistry:
         # Print debug info if test fails
         if len(errors) > 0:
             print(f"Errors: {errors}")
-        if len(results) != 5:
+        if len(results) != len(devices):
             print(f"Results: {results}")
-        if len(set(results)) != 5:
+        if len(set(results)) != len(devices):
             print(f"Unique results: {set(results)}")
         
         # Verify no errors occurred and all devices were registered
         assert len(errors) == 0
-        assert len(results) == 5
-        assert len(set(results)) == 5  # All IDs should be unique
+        assert len(results) == len(devices)
+        assert len(set(results)) == len(devices)  # All IDs should be unique
         
         # Verify all devices are in registry
-        all_devices = registry.get_all()
-        assert len(all_devices) == 5
+        all_devices = file_registry.get_all()
+        assert len(all_devices) == len(devices)
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork()")
+    def test_multiprocess_access_safety(self, file_registry):
+        """Test that registrations from separate processes sharing one file are all kept."""
+        process_count = 2
+        device_count = 10
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_register_in_process,
+                            args=(file_registry.registry_path, process_index, device_count))
+            for process_index in range(process_count)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+        
+        assert [process.exitcode for process in processes] == [0] * process_count
+        
+        stable_ids = [device.stable_id for device in file_registry.get_all()]
+        assert len(stable_ids) == process_count * device_count
+        assert len(set(stable_ids)) == len(stable_ids)
     
     def test_serialization_deserialization(self, registry, sample_device):
         """Test that device data is correctly serialized and deserialized."""
@@ -355,6 +424,153 @@ class TestDeviceRegistry:
         # Cleanup
         registry.registry_path.unlink()
         registry.registry_dir.rmdir()
+    
+    def test_memory_backend_shares_state_without_disk(self, temp_registry_path, sample_device):
+        """Test that memory-backed registries share data in-process and skip the disk."""
+        try:
+            first = DeviceRegistry(temp_registry_path, backend="memory")
+            second = DeviceRegistry(temp_registry_path, backend="memory")
+            
+            stable_id = first.register(sample_device)
+            second.update_status(stable_id, DeviceStatus.DISCONNECTED)
+            
+            assert first.get_by_id(stable_id).status == DeviceStatus.DISCONNECTED
+            assert not temp_registry_path.exists()
+            
+            with pytest.raises(RegistryError):
+                second.register(sample_device)
+        finally:
+            DeviceRegistry.clear_memory_stores()
+    
+    def test_memory_backend_selected_from_environment(self, temp_registry_path, monkeypatch):
+        """Test that the registry backend can be selected via environment variable."""
+        monkeypatch.setenv(DeviceRegistry.BACKEND_ENV_VAR, "memory")
+        try:
+            registry = DeviceRegistry(temp_registry_path)
+            assert registry.backend == DeviceRegistry.BACKEND_MEMORY
+            assert registry.get_all() == []
+        finally:
+            DeviceRegistry.clear_memory_stores()
+    
+    def test_unknown_backend_raises_error(self, temp_registry_path):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(RegistryError):
+            DeviceRegistry(temp_registry_path, backend="sqlite")
+    
+    @pytest.mark.parametrize("durability, expect_fsync", [("strict", True), ("none", False)])
+    def test_durability_controls_fsync(self, temp_registry_path, sample_device, durability, expect_fsync):
+        """Test that writes are fsync'd only with strict durability."""
+        registry = DeviceRegistry(temp_registry_path, durability=durability)
+        
+        with patch('stablecam.registry.os.fsync') as mock_fsync:
+            stable_id = registry.register(sample_device)
+            registry.update_status(stable_id, DeviceStatus.DISCONNECTED)
+        
+        assert mock_fsync.called == expect_fsync
+        assert registry.get_by_id(stable_id).status == DeviceStatus.DISCONNECTED
+    
+    def test_unknown_durability_raises_error(self, temp_registry_path):
+        """Test that an unknown durability mode is rejected."""
+        with pytest.raises(RegistryError):
+            DeviceRegistry(temp_registry_path, durability="group")
+    
+    @pytest.mark.parametrize("multiprocess, expect_flock", [(True, True), (False, False)])
+    def test_multiprocess_controls_flock(self, temp_registry_path, sample_device, multiprocess, expect_flock):
+        """Test that flock() is only taken when other processes may share the file."""
+        registry = DeviceRegistry(temp_registry_path, multiprocess=multiprocess)
+        
+        with patch("stablecam.registry.fcntl.flock") as mock_flock:
+            stable_id = registry.register(sample_device)
+            assert registry.get_by_id(stable_id) is not None
+        
+        assert mock_flock.called == expect_flock
+    
+    def test_multiprocess_is_default(self, temp_registry_path, monkeypatch):
+        """Test that flock() locking is used unless explicitly disabled."""
+        monkeypatch.delenv(DeviceRegistry.MULTIPROCESS_ENV_VAR, raising=False)
+        assert DeviceRegistry(temp_registry_path).multiprocess is True
+    
+    def test_multiprocess_disabled_from_environment(self, temp_registry_path, monkeypatch):
+        """Test that single-process users can opt out of flock() via environment variable."""
+        monkeypatch.setenv(DeviceRegistry.MULTIPROCESS_ENV_VAR, "0")
+        assert DeviceRegistry(temp_registry_path).multiprocess is False
+    
+    def test_register_migrates_version_1_0_registry(self, file_registry, sample_device, sample_device_no_serial):
+        """Test that registering into a 1.0 registry derives next_id from existing IDs."""
+        file_registry.register(sample_device)
+        
+        # Rewrite the file as a 1.0 registry holding only stable-cam-003
+        with open(file_registry.registry_path) as f:
+            data = json.load(f)
+        device_data = data["devices"].pop("stable-cam-001")
+        device_data["stable_id"] = "stable-cam-003"
+        data["devices"]["stable-cam-003"] = device_data
+        data["version"] = "1.0"
+        del data["next_id"]
+        with open(file_registry.registry_path, 'w') as f:
+            json.dump(data, f)
+        
+        registry = DeviceRegistry(file_registry.registry_path)
+        assert registry.register(sample_device_no_serial) == "stable-cam-004"
+        
+        with open(file_registry.registry_path) as f:
+            data = json.load(f)
+        assert data["version"] == "1.1"
+        assert data["next_id"] == 5
+    
+    def test_unchanged_registry_file_is_parsed_once(self, file_registry, sample_device):
+        """Test that reads of an unchanged registry file reuse the last parse."""
+        stable_id = file_registry.register(sample_device)
+        
+        with patch.object(DeviceRegistry, "_load_mapped", wraps=DeviceRegistry._load_mapped) as mock_load:
+            assert [d.stable_id for d in file_registry.get_all()] == [stable_id]
+            assert file_registry.get_by_id(stable_id) is not None
+            assert mock_load.call_count == 1
+            
+            # Writes through the registry are picked up on the next read
+            file_registry.update_status(stable_id, DeviceStatus.DISCONNECTED)
+            assert file_registry.get_by_id(stable_id).status == DeviceStatus.DISCONNECTED
+            assert mock_load.call_count == 2
+    
+    def test_externally_modified_registry_file_is_reparsed(self, file_registry, sample_device):
+        """Test that a registry file changed by another process is read again."""
+        stable_id = file_registry.register(sample_device)
+        assert file_registry.get_by_id(stable_id).status == DeviceStatus.CONNECTED
+        
+        # Another registry instance stands in for a second process
+        DeviceRegistry(file_registry.registry_path).update_status(stable_id, DeviceStatus.DISCONNECTED)
+        
+        assert file_registry.get_by_id(stable_id).status == DeviceStatus.DISCONNECTED
+    
+    def test_same_size_replacement_with_same_mtime_is_reparsed(self, file_registry, sample_device):
+        """Test that a replaced registry file is read again even if size and mtime match."""
+        stable_id = file_registry.register(sample_device)
+        assert file_registry.get_by_id(stable_id).device_info.label == sample_device.label
+        
+        registry_path = file_registry.registry_path
+        st = os.stat(registry_path)
+        with open(registry_path) as f:
+            data = json.load(f)
+        data["devices"][stable_id]["label"] = "X" * len(sample_device.label)
+        
+        # Replace the file with same-size contents carrying the old timestamps
+        tmp_path = registry_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp_path, registry_path)
+        assert os.stat(registry_path).st_size == st.st_size
+        
+        assert file_registry.get_by_id(stable_id).device_info.label == "X" * len(sample_device.label)
+    
+    def test_mutating_returned_platform_data_does_not_leak(self, file_registry, sample_device):
+        """Test that editing a returned device's platform data doesn't change later reads."""
+        stable_id = file_registry.register(sample_device)
+        
+        file_registry.get_by_id(stable_id).device_info.platform_data["driver"] = "changed"
+        file_registry.get_all()[0].device_info.platform_data["extra"] = True
+        
+        assert file_registry.get_by_id(stable_id).device_info.platform_data == sample_device.platform_data
 
 
 if __name__ == "__main__":
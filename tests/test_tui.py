@@ -5,10 +5,13 @@ This module tests the terminal user interface functionality including
 device display, real-time updates, and user interactions.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 # Skip all tests if textual is not available
 pytest_plugins = []
@@ -20,24 +23,57 @@ except ImportError:
     TEXTUAL_AVAILABLE = False
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_stablecam():
+    """Patch the StableCam class used by the TUI once for the whole module."""
+    if not TEXTUAL_AVAILABLE:
+        yield None
+        return
+    with patch('stablecam.tui.StableCam') as mock_stablecam_class:
+        yield mock_stablecam_class
+
+
+@pytest.fixture(scope="module")
+def tui_event_loop():
+    """One event loop for every coroutine the module's tests drive."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def mock_stablecam_class(_patch_stablecam):
+    """Provide the module-wide StableCam class mock, reset for each test."""
+    _patch_stablecam.reset_mock(return_value=True)
+    return _patch_stablecam
+
+
 @pytest.mark.skipif(not TEXTUAL_AVAILABLE, reason="Textual not available")
 class TestDeviceTable:
     """Test cases for the DeviceTable widget."""
     
-    def test_device_table_initialization(self):
-        """Test that DeviceTable class is properly defined."""
+    def test_device_table_initialization(self, tui_event_loop):
+        """Test that DeviceTable is configured correctly once mounted."""
         from stablecam.tui import DeviceTable
+        from textual.app import App
         from textual.widgets import DataTable
         
         # Verify DeviceTable inherits from DataTable
         assert issubclass(DeviceTable, DataTable)
         
-        # Test cursor_type and zebra_stripes are set correctly in __init__
-        # We'll test this by checking the class definition rather than instantiating
-        import inspect
-        source = inspect.getsource(DeviceTable.__init__)
-        assert 'cursor_type = "row"' in source
-        assert 'zebra_stripes = True' in source
+        class TableApp(App):
+            def compose(self):
+                yield DeviceTable()
+        
+        async def mount_table():
+            app = TableApp()
+            async with app.run_test():
+                table = app.query_one(DeviceTable)
+                return table.cursor_type, table.zebra_stripes
+        
+        cursor_type, zebra_stripes = tui_event_loop.run_until_complete(mount_table())
+        assert cursor_type == "row"
+        assert zebra_stripes is True
 
 
 @pytest.mark.skipif(not TEXTUAL_AVAILABLE, reason="Textual not available")
@@ -81,6 +117,13 @@ class TestStableCamTUI:
         manager.on.return_value = None
         return manager
     
+    @pytest.fixture
+    def tui(self, tui_event_loop):
+        """Create a TUI app, unmounted after the test."""
+        tui = StableCamTUI()
+        yield tui
+        tui_event_loop.run_until_complete(tui.on_unmount())
+    
     @pytest.fixture
     def sample_devices(self):
         """Create sample device data for testing."""
@@ -122,43 +165,35 @@ class TestStableCamTUI:
         
         return [registered1, registered2]
     
-    def test_tui_initialization(self, mock_manager):
+    def test_tui_initialization(self, mock_stablecam_class, mock_manager):
         """Test TUI initialization with custom registry path."""
         registry_path = "/custom/path/registry.json"
+        mock_stablecam_class.return_value = mock_manager
         
-        with patch('stablecam.tui.StableCam') as mock_stablecam_class:
-            mock_stablecam_class.return_value = mock_manager
-            
-            tui = StableCamTUI(registry_path=registry_path)
-            
-            assert tui.registry_path == registry_path
-            assert tui.manager is None  # Not initialized until mount
-            assert tui.devices == []
+        tui = StableCamTUI(registry_path=registry_path)
+        
+        assert tui.registry_path == registry_path
+        assert tui.manager is None  # Not initialized until mount
+        mock_stablecam_class.assert_not_called()
+        assert tui.devices == []
     
-    @patch('stablecam.tui.StableCam')
-    def test_tui_mount_initialization(self, mock_stablecam_class, mock_manager):
+    def test_tui_mount_initialization(self, mock_stablecam_class, mock_manager, tui, tui_event_loop):
         """Test TUI mount process and manager initialization."""
         mock_stablecam_class.return_value = mock_manager
         
-        tui = StableCamTUI()
-        
         # Simulate mount process
-        with patch.object(tui, 'set_interval') as mock_set_interval:
-            with patch.object(tui, '_refresh_devices') as mock_refresh:
-                with patch.object(tui, '_update_status') as mock_update_status:
-                    # Call on_mount directly since we can't easily test the async mount
-                    import asyncio
-                    asyncio.run(tui.on_mount())
+        with patch.object(tui, 'set_interval'), patch.object(tui, '_refresh_devices'), \
+             patch.object(tui, '_update_status'):
+            # Call on_mount directly since we can't easily test the async mount
+            tui_event_loop.run_until_complete(tui.on_mount())
         
         # Verify manager was initialized and configured
         mock_stablecam_class.assert_called_once_with(registry_path=None)
         mock_manager.on.assert_called()  # Event handlers should be set up
         mock_manager.run.assert_called_once()  # Monitoring should start
     
-    def test_get_status_display(self, mock_manager):
+    def test_get_status_display(self, mock_manager, tui):
         """Test status display formatting for different device states."""
-        tui = StableCamTUI()
-        
         # Test connected device
         connected_device = Mock()
         connected_device.status = DeviceStatus.CONNECTED
@@ -180,44 +215,34 @@ class TestStableCamTUI:
         assert indicator == "✗ Error"
         assert css_class == "error"
     
-    def test_recent_change_tracking(self, mock_manager):
+    def test_recent_change_tracking(self, mock_manager, tui):
         """Test tracking of recent device status changes."""
-        tui = StableCamTUI()
-        
         stable_id = "stable-cam-001"
         
-        # Initially no recent changes
-        assert not tui._is_recent_change(stable_id)
-        
-        # Mark as recent change
-        tui._mark_recent_change(stable_id)
-        assert tui._is_recent_change(stable_id)
-        
-        # Simulate time passing (mock datetime)
-        with patch('stablecam.tui.datetime') as mock_datetime:
-            # Get the original time and add 6 seconds using timedelta
-            from datetime import timedelta
-            original_time = tui._recent_changes[stable_id]
-            future_time = original_time + timedelta(seconds=6)
-            mock_datetime.now.return_value = future_time
+        with patch('stablecam.tui.time.monotonic', return_value=100.0) as mock_monotonic:
+            # Initially no recent changes
+            assert not tui._is_recent_change(stable_id)
+            
+            # Mark as recent change
+            tui._mark_recent_change(stable_id)
+            assert tui._is_recent_change(stable_id)
+            
+            # Simulate time passing
+            mock_monotonic.return_value = 106.0
             
             # Should no longer be recent (>5 seconds)
             assert not tui._is_recent_change(stable_id)
     
-    @patch('stablecam.tui.StableCam')
-    def test_refresh_devices(self, mock_stablecam_class, mock_manager, sample_devices):
+    def test_refresh_devices(self, mock_manager, sample_devices, tui, tui_event_loop):
         """Test device list refresh functionality."""
-        mock_stablecam_class.return_value = mock_manager
         mock_manager.list.return_value = sample_devices
         
-        tui = StableCamTUI()
         tui.manager = mock_manager
         
         # Mock the table update method
-        with patch.object(tui, '_update_device_table') as mock_update_table:
-            with patch.object(tui, '_update_status') as mock_update_status:
-                import asyncio
-                asyncio.run(tui._refresh_devices())
+        with patch.object(tui, '_update_device_table') as mock_update_table, \
+             patch.object(tui, '_update_status') as mock_update_status:
+            tui_event_loop.run_until_complete(tui._refresh_devices())
         
         # Verify devices were loaded
         assert len(tui.devices) == 2
@@ -228,8 +253,7 @@ class TestStableCamTUI:
         mock_update_table.assert_called_once()
         mock_update_status.assert_called()
     
-    @patch('stablecam.tui.StableCam')
-    def test_register_new_device(self, mock_stablecam_class, mock_manager):
+    def test_register_new_device(self, mock_manager, tui, tui_event_loop):
         """Test registering a new device through the TUI."""
         # Set up mock data
         new_device = CameraDevice(
@@ -242,52 +266,60 @@ class TestStableCamTUI:
             platform_data={}
         )
         
-        mock_stablecam_class.return_value = mock_manager
         mock_manager.detect.return_value = [new_device]
         mock_manager.register.return_value = "stable-cam-003"
         
-        tui = StableCamTUI()
         tui.manager = mock_manager
         tui.devices = []  # No existing devices
         
-        with patch.object(tui, '_refresh_devices') as mock_refresh:
-            with patch.object(tui, '_update_status') as mock_update_status:
-                import asyncio
-                asyncio.run(tui._register_new_device())
+        with patch.object(tui, '_refresh_devices') as mock_refresh, patch.object(tui, '_update_status'):
+            tui_event_loop.run_until_complete(tui._register_new_device())
         
         # Verify registration was attempted
         mock_manager.detect.assert_called_once()
         mock_manager.register.assert_called_once_with(new_device)
         mock_refresh.assert_called_once()
     
-    @patch('stablecam.tui.StableCam')
-    def test_register_no_new_devices(self, mock_stablecam_class, mock_manager, sample_devices):
+    def test_register_no_new_devices(self, mock_manager, sample_devices, tui, tui_event_loop):
         """Test registration when no new devices are available."""
         # Mock detection returning already registered device
         existing_device = sample_devices[0].device_info
         
-        mock_stablecam_class.return_value = mock_manager
         mock_manager.detect.return_value = [existing_device]
         
-        tui = StableCamTUI()
         tui.manager = mock_manager
         tui.devices = sample_devices  # Existing registered devices
         
         with patch.object(tui, '_update_status') as mock_update_status:
-            import asyncio
-            asyncio.run(tui._register_new_device())
+            tui_event_loop.run_until_complete(tui._register_new_device())
         
         # Should not attempt registration
         mock_manager.register.assert_not_called()
         mock_update_status.assert_called_with("All detected cameras are already registered")
     
-    def test_event_handlers(self, mock_manager):
-        """Test device event handlers."""
-        tui = StableCamTUI()
+    def test_pending_changes_keep_latest_time(self, tui):
+        """Test that pending changes are folded in order, keeping each device's latest time."""
+        with patch('stablecam.tui.time.monotonic', side_effect=[10.0, 11.0, 12.0, 13.0]):
+            tui._on_device_connect(SimpleNamespace(stable_id="stable-cam-001"))
+            tui._on_device_connect(SimpleNamespace(stable_id="stable-cam-002"))
+            tui._on_device_disconnect(SimpleNamespace(stable_id="stable-cam-001"))
+            
+            # Events stay pending until the next read
+            assert tui._recent_changes == {}
+            assert tui._is_recent_change("stable-cam-001")
         
+        assert tui._recent_changes == {"stable-cam-001": 12.0, "stable-cam-002": 11.0}
+        assert len(tui._pending_change_times) == 0
+    
+    def test_event_handlers(self, mock_manager, tui):
+        """Test device event handlers."""
         device = Mock()
         device.stable_id = "stable-cam-001"
         
+        # Handlers run on the monitor thread, so they must be plain functions
+        for handler in (tui._on_device_connect, tui._on_device_disconnect, tui._on_device_status_change):
+            assert not asyncio.iscoroutinefunction(handler)
+        
         # Test connect event
         tui._on_device_connect(device)
         assert tui._is_recent_change("stable-cam-001")
@@ -350,23 +382,18 @@ class TestTUIIntegration:
         assert tui.SUB_TITLE == "Real-time camera monitoring with stable IDs"
     
     @pytest.mark.skipif(not TEXTUAL_AVAILABLE, reason="Textual not available")
-    @patch('stablecam.tui.StableCam')
-    def test_tui_cleanup_on_unmount(self, mock_stablecam_class):
+    def test_tui_cleanup_on_unmount(self, tui_event_loop):
         """Test proper cleanup when TUI is unmounted."""
-        mock_manager = Mock()
-        mock_stablecam_class.return_value = mock_manager
+        calls = []
         
         tui = StableCamTUI()
-        tui.manager = mock_manager
         
-        # Mock timer
-        mock_timer = Mock()
-        tui.update_timer = mock_timer
+        # Plain stand-ins recording the stop calls
+        tui.update_timer = SimpleNamespace(stop=lambda: calls.append('timer'))
+        tui.manager = SimpleNamespace(stop=lambda: calls.append('manager'))
         
         # Test unmount
-        import asyncio
-        asyncio.run(tui.on_unmount())
+        tui_event_loop.run_until_complete(tui.on_unmount())
         
-        # Verify cleanup
-        mock_timer.stop.assert_called_once()
-        mock_manager.stop.assert_called_once()
\ No newline at end of file
+        # Verify cleanup stops the timer, then monitoring
+        assert calls == ['timer', 'manager']
\ No newline at end of file